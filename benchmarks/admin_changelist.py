@@ -0,0 +1,113 @@
+"""
+Times the Martyr admin changelist against a large synthetic table.
+
+Builds a throwaway test database, bulk inserts --rows martyrs, runs ANALYZE
+and then renders the changelist with the original admin configuration
+(exact counts, distinct-country filter, date_hierarchy, full rows) and with
+the current MartyrAdmin.
+
+    python benchmarks/admin_changelist.py --rows 1000000
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'catholic_persecution.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib import admin  # noqa: E402
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.test.utils import CaptureQueriesContext, setup_test_environment  # noqa: E402
+
+from martyrs.admin import MartyrAdmin  # noqa: E402
+from martyrs.models import Martyr  # noqa: E402
+
+
+COUNTRIES = ['Nigeria', 'Pakistan', 'India', 'China', 'North Korea', 'Eritrea', 'Iran', 'Unknown']
+
+
+class BaselineMartyrAdmin(admin.ModelAdmin):
+    list_display = ['name', 'country', 'date', 'created_at']
+    search_fields = ['name', 'country', 'description']
+    list_filter = ['country', 'date']
+    date_hierarchy = 'date'
+
+
+def populate(rows):
+    batch = []
+    start = date(2000, 1, 1)
+    description = 'Attacked for the faith. ' * 30
+    for i in range(rows):
+        batch.append(Martyr(
+            name=f'Martyr {i}',
+            country=COUNTRIES[i % len(COUNTRIES)],
+            date=start + timedelta(days=i % 9000),
+            source_url=f'https://example.com/{i}',
+            description=description,
+        ))
+        if len(batch) == 10000:
+            Martyr.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        Martyr.objects.bulk_create(batch)
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+def time_changelist(model_admin, user, params, repeat):
+    factory = RequestFactory()
+    timings = []
+    queries = 0
+    for _ in range(repeat):
+        request = factory.get('/admin/martyrs/martyr/', params)
+        request.user = user
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            model_admin.changelist_view(request).render()
+            timings.append(time.perf_counter() - start)
+        queries = len(context.captured_queries)
+    return statistics.median(timings) * 1000, queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        start = time.perf_counter()
+        populate(args.rows)
+        print(f'Inserted {args.rows} rows in {time.perf_counter() - start:.1f}s')
+        user = User.objects.create_superuser('bench', 'bench@example.com', 'bench')
+
+        scenarios = [
+            ('first page', {}),
+            ('country filter', {'country': 'Nigeria'}),
+            ('page 100', {'p': 100}),
+        ]
+        for label, model_admin in [
+            ('baseline', BaselineMartyrAdmin(Martyr, admin.site)),
+            ('MartyrAdmin', MartyrAdmin(Martyr, admin.site)),
+        ]:
+            for scenario, params in scenarios:
+                ms, queries = time_changelist(model_admin, user, params, args.repeat)
+                print(f'{label:12} {scenario:15} {ms:9.1f} ms  {queries} queries')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Load-test scenario for the public home page.
+
+Hits the first, a middle and the last (deep) martyr page of a running
+server in turn and reports throughput and p50/p95/p99 for each. The page
+count is read from the database the server uses, so fill it first:
+
+    python manage.py generate_synthetic_martyrs 100000 --seed 1
+    gunicorn catholic_persecution.wsgi -w 2 -b 127.0.0.1:8000
+    python benchmarks/home_scenario.py http://127.0.0.1:8000 -c 16 -d 15
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'catholic_persecution.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from http_load import run  # noqa: E402
+from martyrs.models import Martyr  # noqa: E402
+
+
+PER_PAGE = 3
+
+
+def scenarios(num_pages):
+    return [
+        ('first', ['/']),
+        ('middle', [f'/?page={max(1, num_pages // 2)}']),
+        ('deep', [f'/?page={num_pages}', f'/?page={max(1, num_pages - 1)}']),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('base_url')
+    parser.add_argument('-c', '--concurrency', type=int, default=16)
+    parser.add_argument('-d', '--duration', type=float, default=10.0)
+    parser.add_argument('--json', action='store_true', help='Print one JSON line per scenario')
+    args = parser.parse_args()
+
+    rows = Martyr.objects.count()
+    num_pages = max(1, -(-rows // PER_PAGE))
+    if not args.json:
+        print(f'{rows} martyrs, {num_pages} pages, c={args.concurrency}, {args.duration:g}s per scenario')
+        print(f'{"scenario":10} {"requests":>9} {"req/s":>9} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9}  errors')
+
+    for name, paths in scenarios(num_pages):
+        result = asyncio.run(run(args.base_url, paths, args.concurrency, args.duration))
+        result['scenario'] = name
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(f'{name:10} {result["requests"]:9} {result["rps"]:9} {result["p50_ms"]:9} '
+                  f'{result["p95_ms"]:9} {result["p99_ms"]:9}  {result["errors"] or "-"}')
+
+
+if __name__ == '__main__':
+    main()
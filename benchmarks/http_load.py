@@ -0,0 +1,168 @@
+"""
+Minimal closed-loop HTTP load generator (stdlib only).
+
+Each of --concurrency workers keeps one keep-alive connection open and
+issues GET requests back to back for --duration seconds, cycling through
+the given paths. Throughput and latency percentiles are printed at the end.
+
+Comparing WSGI and ASGI for the home page (asgi.py serves the async view
+unless MARTYRS_ASYNC_VIEWS is set), plus the sync view under the same ASGI
+server to separate the server from the view:
+
+    gunicorn catholic_persecution.wsgi -w 1 --threads 8 -b 127.0.0.1:8001
+    MARTYRS_ASYNC_VIEWS=0 uvicorn catholic_persecution.asgi:application --port 8100
+    MARTYRS_ASYNC_VIEWS=1 uvicorn catholic_persecution.asgi:application --port 8101
+
+    python benchmarks/http_load.py http://127.0.0.1:8001 / /?page=2 /?page=500 -c 32 -d 10
+    python benchmarks/http_load.py http://127.0.0.1:8100 / /?page=2 /?page=500 -c 32 -d 10
+    python benchmarks/http_load.py http://127.0.0.1:8101 / /?page=2 /?page=500 -c 32 -d 10
+
+WSGI was faster on this stack. With SQLite every async ORM query still
+hops to the single thread-sensitive executor, so ASGI only adds overhead.
+
+Shipped SQLite database, DEBUG on, one worker, c=32, 8 s, paths / /?page=2:
+
+    gunicorn (sync view)    236 req/s  p99 216 ms
+    uvicorn (async view)    133 req/s  p99 368 ms
+
+3,000 synthetic martyrs, DEBUG off, one worker, c=32, 10 s, first run:
+
+    uvicorn (sync view)     106.2 req/s  p50 289 ms  p95 404 ms  p99 461 ms
+    uvicorn (async view)    126.3 req/s  p50 251 ms  p95 309 ms  p99 325 ms
+
+Same database, second run:
+
+    gunicorn (sync view)    194.4 req/s  p50 160 ms  p95 209 ms  p99 236 ms
+    uvicorn (sync view)     103.2 req/s  p50 304 ms  p95 384 ms  p99 399 ms
+    uvicorn (async view)     99.5 req/s  p50 315 ms  p95 403 ms  p99 447 ms
+
+Under uvicorn the two views are within run-to-run noise of each other.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('connection closed by server')
+    status = int(status_line.split()[1])
+    length = None
+    chunked = False
+    close = False
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        name = name.strip().lower()
+        value = value.strip()
+        if name == 'content-length':
+            length = int(value)
+        elif name == 'transfer-encoding' and 'chunked' in value.lower():
+            chunked = True
+        elif name == 'connection' and value.lower() == 'close':
+            close = True
+
+    if chunked:
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif length is not None:
+        await reader.readexactly(length)
+    else:
+        await reader.read()
+        close = True
+    return status, close
+
+
+async def worker(host, port, paths, offset, deadline, latencies, errors):
+    reader = writer = None
+    i = offset
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            request = f'GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n'
+            start = time.perf_counter()
+            writer.write(request.encode())
+            status, close = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+            if close:
+                writer.close()
+                writer = None
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+            if writer is not None:
+                writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run(base_url, paths, concurrency, duration):
+    parts = urlsplit(base_url)
+    host = parts.hostname
+    port = parts.port or 80
+    latencies = []
+    errors = {}
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*[
+        worker(host, port, paths, n, deadline, latencies, errors) for n in range(concurrency)
+    ])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'url': base_url,
+        'paths': paths,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': errors,
+        'seconds': round(elapsed, 3),
+        'rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('base_url', help='Server root, e.g. http://127.0.0.1:8000')
+    parser.add_argument('paths', nargs='*', default=['/'], help='Paths to request in rotation')
+    parser.add_argument('-c', '--concurrency', type=int, default=32)
+    parser.add_argument('-d', '--duration', type=float, default=10.0)
+    parser.add_argument('--json', action='store_true', help='Print the result as JSON')
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run(args.base_url, args.paths, args.concurrency, args.duration))
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f'{result["url"]} c={result["concurrency"]} requests={result["requests"]} errors={result["errors"]}')
+        print(f'  throughput {result["rps"]} req/s')
+        print(f'  latency p50 {result["p50_ms"]} ms  p95 {result["p95_ms"]} ms  p99 {result["p99_ms"]} ms')
+    return result
+
+
+if __name__ == '__main__':
+    main()
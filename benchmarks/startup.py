@@ -0,0 +1,71 @@
+"""
+Measures cold-start time of short-lived manage.py runs.
+
+For each settings module the command is run --runs times in a fresh
+interpreter and the median wall time is reported, followed by the slowest
+top-level imports from a single ``python -X importtime`` run.
+
+    python benchmarks/startup.py > benchmarks/startup_importtime.txt
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SETTINGS = [
+    'catholic_persecution.settings',
+    'catholic_persecution.settings_worker',
+]
+
+
+def run(settings, command, importtime=False):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings)
+    args = [sys.executable]
+    if importtime:
+        args += ['-X', 'importtime']
+    args += ['manage.py', *command]
+    start = time.perf_counter()
+    result = subprocess.run(args, cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return time.perf_counter() - start, result.stderr
+
+
+def slowest_imports(stderr, limit):
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(cumulative_us), depth, name.strip()))
+    total = sum(cumulative for cumulative, depth, _ in rows if depth == 0)
+    top = sorted((row for row in rows if row[1] <= 1), reverse=True)[:limit]
+    return total, top
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('command', nargs='*', default=['fetch_persecution_data', '--help'])
+    args = parser.parse_args()
+
+    print(f'python {sys.version.split()[0]}, manage.py {" ".join(args.command)}, {args.runs} runs')
+    for settings in SETTINGS:
+        timings = [run(settings, args.command)[0] for _ in range(args.runs)]
+        _, stderr = run(settings, args.command, importtime=True)
+        total, top = slowest_imports(stderr, args.top)
+        print()
+        print(f'{settings}: median {statistics.median(timings) * 1000:.0f} ms, '
+              f'min {min(timings) * 1000:.0f} ms, imports {total / 1000:.0f} ms')
+        for cumulative, depth, name in top:
+            print(f'  {cumulative / 1000:8.1f} ms  {"  " * depth}{name}')
+
+
+if __name__ == '__main__':
+    main()
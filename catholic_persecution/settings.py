@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -41,6 +44,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'martyrs.middleware.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -69,6 +73,10 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'catholic_persecution.wsgi.application'
 
+# Serve the async read views. asgi.py turns this on so ASGI workers don't
+# push every request through the sync_to_async thread pool.
+ASYNC_VIEWS = os.environ.get('MARTYRS_ASYNC_VIEWS') == '1'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
@@ -81,6 +89,55 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+# Row counts, the admin country list, feed versions and rendered martyr cards
+# are cleared by signal handlers and by management commands
+# (generate_synthetic_martyrs, cron scrapes), so a deployment with several
+# web workers or a separate queue worker must point every process at one
+# shared cache with MARTYRS_CACHE_URL:
+#
+#     redis://127.0.0.1:6379/1      RedisCache (needs the redis package)
+#     memcached://127.0.0.1:11211   PyMemcacheCache (needs pymemcache)
+#     db://martyrs_cache            DatabaseCache (run createcachetable first)
+#
+# Without it each process keeps its own local-memory cache, which is fine
+# for runserver and the test suite.
+
+CACHE_URL = os.environ.get('MARTYRS_CACHE_URL', '')
+
+if CACHE_URL.startswith(('redis://', 'rediss://')):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+elif CACHE_URL.startswith('memcached://'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': CACHE_URL.removeprefix('memcached://'),
+        }
+    }
+elif CACHE_URL.startswith('db://'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': CACHE_URL.removeprefix('db://'),
+        }
+    }
+elif CACHE_URL:
+    raise ImproperlyConfigured(f'Unsupported MARTYRS_CACHE_URL: {CACHE_URL}')
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -117,6 +174,33 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Output directory of the build_static_site command, served directly by nginx
+STATIC_SITE_ROOT = BASE_DIR / 'static_site'
+
+# Request performance instrumentation (martyrs.middleware.PerformanceMiddleware)
+
+PERFORMANCE_SERVER_TIMING = True
+
+# Fraction of requests logged to martyrs.performance; off unless set, so
+# test runs and local development stay quiet.
+PERFORMANCE_LOG_SAMPLE_RATE = float(os.environ.get('MARTYRS_PERFORMANCE_LOG_SAMPLE_RATE', '0'))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'martyrs.performance': {
+            'handlers': ['console'],
+            'level': 'INFO',
+        },
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
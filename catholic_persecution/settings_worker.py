@@ -0,0 +1,31 @@
+"""
+Lean settings for short-lived management commands and worker processes.
+
+Cron-triggered scrapes and queue workers never serve admin pages, sessions
+or flash messages, so booting those apps only adds import and check time.
+
+    DJANGO_SETTINGS_MODULE=catholic_persecution.settings_worker python manage.py fetch_persecution_data
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import TEMPLATES
+
+
+INSTALLED_APPS = [
+    'martyrs',
+]
+
+MIDDLEWARE = []
+
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+            ],
+        },
+    },
+]
+
+AUTH_PASSWORD_VALIDATORS = []
@@ -1,13 +1,83 @@
 from django.contrib import admin
-from .models import Martyr, PrayerIntention
+from django.contrib.admin.views.main import ChangeList
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+from .models import EnrichmentJob, Martyr, PrayerIntention
+from .signals import COUNTRY_LIST_KEY, COUNTRY_LIST_TIMEOUT
+
+
+# Below this many rows an exact COUNT(*) is cheap enough to keep.
+EXACT_COUNT_THRESHOLD = 50000
+
+
+def estimated_row_count(model):
+    """
+    Row count from PostgreSQL's planner statistics, or None if unavailable.
+
+    SQLite is left out on purpose: sqlite_stat1 is only refreshed by ANALYZE,
+    so its count falls behind as rows are added and the last changelist
+    pages would become unreachable.
+    """
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [model._meta.db_table])
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+class EstimatedCountPaginator(Paginator):
+    """Uses planner statistics instead of COUNT(*) for large unfiltered changelists."""
+
+    @cached_property
+    def count(self):
+        if not self.object_list.query.has_filters():
+            estimate = estimated_row_count(self.object_list.model)
+            if estimate is not None and estimate >= EXACT_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+class ProjectedChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.only(*self.model_admin.changelist_fields)
+
+
+class CountryListFilter(admin.SimpleListFilter):
+    title = 'country'
+    parameter_name = 'country'
+
+    def lookups(self, request, model_admin):
+        countries = cache.get(COUNTRY_LIST_KEY)
+        if countries is None:
+            countries = list(
+                Martyr.objects.order_by('country').values_list('country', flat=True).distinct()
+            )
+            cache.set(COUNTRY_LIST_KEY, countries, COUNTRY_LIST_TIMEOUT)
+        return [(country, country) for country in countries]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(country=self.value())
+        return queryset
 
 
 @admin.register(Martyr)
 class MartyrAdmin(admin.ModelAdmin):
     list_display = ['name', 'country', 'date', 'created_at']
     search_fields = ['name', 'country', 'description']
-    list_filter = ['country', 'date']
-    date_hierarchy = 'date'
+    list_filter = [CountryListFilter, 'date']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    changelist_fields = ['id', 'name', 'country', 'date', 'created_at']
+
+    def get_changelist(self, request, **kwargs):
+        return ProjectedChangeList
 
 
 @admin.register(PrayerIntention)
@@ -15,3 +85,10 @@ class PrayerIntentionAdmin(admin.ModelAdmin):
     list_display = ['title', 'created_at']
     search_fields = ['title', 'details']
     date_hierarchy = 'created_at'
+
+
+@admin.register(EnrichmentJob)
+class EnrichmentJobAdmin(admin.ModelAdmin):
+    list_display = ['url', 'status', 'attempts', 'updated_at']
+    list_filter = ['status']
+    raw_id_fields = ['martyr']
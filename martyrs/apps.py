@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class MartyrsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'martyrs'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .middleware import install_query_recorder
+
+        connection_created.connect(install_query_recorder)
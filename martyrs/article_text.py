@@ -0,0 +1,126 @@
+from html.parser import HTMLParser
+
+
+# Article body containers in the order fetch_article_content used to try
+# them with BeautifulSoup: 'article .content', 'article .post-content',
+# '.article-content', '.entry-content', 'main article', 'article' and
+# '.content'. Each is (required ancestor tag, tag, class); None matches any.
+# As with select_one(), only the first element matching a selector counts.
+CONTENT_SELECTORS = [
+    ('article', None, 'content'),
+    ('article', None, 'post-content'),
+    (None, None, 'article-content'),
+    (None, None, 'entry-content'),
+    ('main', 'article', None),
+    (None, 'article', None),
+    (None, None, 'content'),
+]
+
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr',
+}
+SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+
+
+class ArticleTextParser(HTMLParser):
+    """
+    Incremental parser that collects paragraph text from an article page.
+
+    Paragraphs are collected separately for the first element matching each
+    of CONTENT_SELECTORS, and text() picks the highest-priority one with
+    enough text. Once the highest-priority container seen so far holds
+    ``limit`` characters, ``done`` is set so the caller can stop
+    downloading. The first ``fallback_paragraphs`` paragraphs anywhere on
+    the page are kept for pages without a container.
+    """
+
+    def __init__(self, limit=1000, fallback_paragraphs=10):
+        super().__init__()
+        self.limit = limit
+        self.fallback_paragraphs = fallback_paragraphs
+        self.stack = []
+        self.open_selectors = set()
+        self.skip_depth = 0
+        self.paragraph = None
+        self.paragraph_selectors = ()
+        self.content = {}
+        self.content_length = {}
+        self.fallback = []
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            return
+        if tag == 'p':
+            if self.paragraph is not None:
+                self.end_paragraph()
+            self.paragraph = []
+            self.paragraph_selectors = tuple(self.open_selectors)
+
+        classes = set()
+        for name, value in attrs:
+            if name == 'class' and value:
+                classes.update(value.split())
+        selectors = []
+        for index, (ancestor, selector_tag, selector_class) in enumerate(CONTENT_SELECTORS):
+            if index in self.content:
+                continue
+            if selector_tag is not None and tag != selector_tag:
+                continue
+            if selector_class is not None and selector_class not in classes:
+                continue
+            if ancestor is not None and not any(name == ancestor for name, _ in self.stack):
+                continue
+            self.content[index] = []
+            self.content_length[index] = 0
+            selectors.append(index)
+        self.stack.append((tag, selectors))
+        self.open_selectors.update(selectors)
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        pass
+
+    def handle_endtag(self, tag):
+        if not any(name == tag for name, _ in self.stack):
+            return
+        while self.stack:
+            name, selectors = self.stack.pop()
+            if name == 'p' and self.paragraph is not None:
+                self.end_paragraph()
+            self.open_selectors.difference_update(selectors)
+            if name in SKIP_TAGS:
+                self.skip_depth -= 1
+            if name == tag:
+                break
+
+    def handle_data(self, data):
+        if self.paragraph is not None and not self.skip_depth:
+            data = data.strip()
+            if data:
+                self.paragraph.append(data)
+
+    def end_paragraph(self):
+        text = ''.join(self.paragraph)
+        self.paragraph = None
+        if not text:
+            return
+        if len(self.fallback) < self.fallback_paragraphs:
+            self.fallback.append(text)
+        for index in self.paragraph_selectors:
+            self.content[index].append(text)
+            self.content_length[index] += len(text) + 1
+        if self.content and self.content_length[min(self.content)] >= self.limit:
+            self.done = True
+
+    def text(self):
+        if self.paragraph is not None:
+            self.end_paragraph()
+        for index in sorted(self.content):
+            content = ' '.join(self.content[index])
+            if len(content) > 50:
+                return content[:self.limit]
+        fallback = ' '.join(self.fallback)
+        return fallback[:self.limit] if fallback else None
@@ -0,0 +1,128 @@
+from functools import wraps
+
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed
+from django.views.decorators.http import condition
+
+from .models import Martyr, PrayerIntention
+from .signals import FEED_CACHE_TIMEOUT, feed_cache_version
+
+
+FEED_ITEMS = 30
+
+
+def cached_feed(feed):
+    """
+    Serve a feed's XML from the cache, keyed by the feed model's cache
+    version that writes bump, and answer matching If-None-Match requests
+    with a 304 before anything is rendered.
+    """
+
+    def feed_etag(request, *args, **kwargs):
+        return f'{feed_cache_version(feed.model)}:{request.path}'
+
+    @wraps(feed)
+    def view(request, *args, **kwargs):
+        key = f'martyrs:feed:{feed_cache_version(feed.model)}:{request.path}'
+        cached = cache.get(key)
+        if cached is None:
+            response = feed(request, *args, **kwargs)
+            cached = (response.content, response['Content-Type'], response.get('Last-Modified'))
+            cache.set(key, cached, FEED_CACHE_TIMEOUT)
+        content, content_type, last_modified = cached
+        response = HttpResponse(content, content_type=content_type)
+        if last_modified:
+            response['Last-Modified'] = last_modified
+        return response
+
+    return condition(etag_func=feed_etag)(view)
+
+
+class LatestMartyrsFeed(Feed):
+    model = Martyr
+    title = 'Prayer for the Persecuted: Recent Martyrs'
+    description = 'Christians recently killed, imprisoned or attacked for their faith.'
+
+    def link(self):
+        return reverse('martyrs:home')
+
+    def items(self):
+        return Martyr.objects.order_by('-created_at')[:FEED_ITEMS]
+
+    def item_title(self, item):
+        return f'{item.name} - {item.country}'
+
+    def item_description(self, item):
+        return item.description
+
+    def item_link(self, item):
+        return item.source_url
+
+    def item_guid(self, item):
+        return f'martyr-{item.pk}'
+
+    item_guid_is_permalink = False
+
+    def item_pubdate(self, item):
+        return item.created_at
+
+
+class LatestMartyrsAtomFeed(LatestMartyrsFeed):
+    feed_type = Atom1Feed
+    subtitle = LatestMartyrsFeed.description
+
+
+class CountryMartyrsFeed(LatestMartyrsFeed):
+    def get_object(self, request, country):
+        name = Martyr.objects.filter(country__iexact=country).values_list('country', flat=True).first()
+        if name is None:
+            raise Martyr.DoesNotExist
+        return name
+
+    def title(self, obj):
+        return f'Prayer for the Persecuted: Martyrs in {obj}'
+
+    def description(self, obj):
+        return f'Christians recently killed, imprisoned or attacked for their faith in {obj}.'
+
+    def items(self, obj):
+        return Martyr.objects.filter(country=obj).order_by('-created_at')[:FEED_ITEMS]
+
+
+class CountryMartyrsAtomFeed(CountryMartyrsFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
+
+
+class PrayerIntentionsFeed(Feed):
+    model = PrayerIntention
+    title = 'Prayer for the Persecuted: Prayer Intentions'
+    description = 'New intentions to pray for persecuted Christians.'
+
+    def link(self):
+        return reverse('martyrs:home')
+
+    def items(self):
+        return PrayerIntention.objects.all()[:FEED_ITEMS]
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return item.details
+
+    def item_link(self, item):
+        return f'{reverse("martyrs:home")}#intention-{item.pk}'
+
+    def item_pubdate(self, item):
+        return item.created_at
+
+
+class PrayerIntentionsAtomFeed(PrayerIntentionsFeed):
+    feed_type = Atom1Feed
+    subtitle = PrayerIntentionsFeed.description
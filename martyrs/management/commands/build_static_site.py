@@ -0,0 +1,172 @@
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.paginator import Page, Paginator
+from django.template.loader import get_template, render_to_string
+from django.test import RequestFactory
+from django.utils.safestring import mark_safe
+
+from martyrs.models import Martyr, PrayerIntention
+from martyrs.views import CARD_TEMPLATE, MARTYR_CARD_FIELDS
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+PER_PAGE = 3
+
+MARTYR_FIELDS = MARTYR_CARD_FIELDS
+PRAYER_FIELDS = ['id', 'title', 'details', 'created_at']
+
+TEMPLATES = ['martyrs/home.html', 'martyrs/martyr_card.html', 'base.html']
+
+
+class Command(BaseCommand):
+    help = (
+        'Pre-render the public home pages to static HTML with gzip/brotli variants. '
+        'Only pages whose rows changed since the last build are re-rendered. '
+        'index.html is the first page, page-N.html is ?page=N and '
+        'prayer-page-N.html is ?prayer_page=N; other combinations fall through to Django.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            type=str,
+            help='Directory to write the site to (defaults to STATIC_SITE_ROOT)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-render every page even if its rows are unchanged',
+        )
+
+    def handle(self, *args, **options):
+        output = Path(options['output'] or settings.STATIC_SITE_ROOT)
+        output.mkdir(parents=True, exist_ok=True)
+        manifest_path = output / 'manifest.json'
+
+        manifest = {}
+        if manifest_path.exists() and not options['force']:
+            manifest = json.loads(manifest_path.read_text())
+
+        template_hash = self.template_hash()
+        previous = manifest.get('pages', {}) if manifest.get('template') == template_hash else {}
+        pages = {}
+        self.rendered = 0
+        self.factory = RequestFactory()
+        self.card_template = get_template(CARD_TEMPLATE)
+
+        prayers = list(PrayerIntention.objects.only(*PRAYER_FIELDS))
+        prayer_paginator = self.paginator(prayers, len(prayers))
+        prayer_chunks = [prayers[i:i + PER_PAGE] for i in range(0, len(prayers), PER_PAGE)] or [[]]
+
+        martyr_count = Martyr.objects.count()
+        martyr_paginator = self.paginator(None, martyr_count)
+        first_martyr_chunk = None
+
+        for number, chunk in enumerate(self.martyr_chunks(), start=1):
+            if number == 1:
+                first_martyr_chunk = chunk
+            filename = 'index.html' if number == 1 else f'page-{number}.html'
+            pages[filename] = self.build_page(
+                output, filename, previous,
+                Page(chunk, number, martyr_paginator),
+                Page(prayer_chunks[0], 1, prayer_paginator),
+                {'page': number} if number > 1 else {},
+            )
+
+        if first_martyr_chunk is None:
+            first_martyr_chunk = []
+            pages['index.html'] = self.build_page(
+                output, 'index.html', previous,
+                Page([], 1, martyr_paginator),
+                Page(prayer_chunks[0], 1, prayer_paginator),
+                {},
+            )
+
+        for number, chunk in enumerate(prayer_chunks[1:], start=2):
+            filename = f'prayer-page-{number}.html'
+            pages[filename] = self.build_page(
+                output, filename, previous,
+                Page(first_martyr_chunk, 1, martyr_paginator),
+                Page(chunk, number, prayer_paginator),
+                {'prayer_page': number},
+            )
+
+        removed = 0
+        for filename in set(previous) - set(pages):
+            for suffix in ('', '.gz', '.br'):
+                (output / f'{filename}{suffix}').unlink(missing_ok=True)
+            removed += 1
+
+        manifest_path.write_text(json.dumps({'template': template_hash, 'pages': pages}, indent=2, sort_keys=True))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Static site: {self.rendered} rendered, {len(pages) - self.rendered} unchanged, '
+            f'{removed} removed ({output})'
+        ))
+
+    def paginator(self, object_list, count):
+        paginator = Paginator(object_list, PER_PAGE)
+        paginator.count = count
+        return paginator
+
+    def martyr_chunks(self):
+        chunk = []
+        for martyr in Martyr.objects.only(*MARTYR_FIELDS).iterator(chunk_size=2000):
+            chunk.append(martyr)
+            if len(chunk) == PER_PAGE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def template_hash(self):
+        digest = hashlib.sha256()
+        for name in TEMPLATES:
+            digest.update(Path(get_template(name).origin.name).read_bytes())
+        return digest.hexdigest()
+
+    def fingerprint(self, martyrs, prayer_intentions):
+        digest = hashlib.sha256()
+        digest.update(repr((martyrs.number, martyrs.paginator.num_pages)).encode())
+        for martyr in martyrs:
+            digest.update(repr([getattr(martyr, f) for f in MARTYR_FIELDS]).encode())
+        digest.update(repr((prayer_intentions.number, prayer_intentions.paginator.num_pages)).encode())
+        for intention in prayer_intentions:
+            digest.update(repr([getattr(intention, f) for f in PRAYER_FIELDS]).encode())
+        return digest.hexdigest()
+
+    def build_page(self, output, filename, previous, martyrs, prayer_intentions, params):
+        fingerprint = self.fingerprint(martyrs, prayer_intentions)
+        if previous.get(filename) == fingerprint and (output / filename).exists():
+            return fingerprint
+
+        request = self.factory.get('/', params)
+        html = render_to_string('martyrs/home.html', {
+            'martyrs': martyrs,
+            # Rendered directly rather than through the card cache: a full
+            # build touches every row and would push out the cards live
+            # traffic is using.
+            'martyr_cards': [mark_safe(self.card_template.render({'martyr': martyr})) for martyr in martyrs],
+            'prayer_intentions': prayer_intentions,
+        }, request=request).encode()
+
+        self.write_atomic(output / filename, html)
+        self.write_atomic(output / f'{filename}.gz', gzip.compress(html, compresslevel=9, mtime=0))
+        if brotli is not None:
+            self.write_atomic(output / f'{filename}.br', brotli.compress(html, quality=11))
+        self.rendered += 1
+        return fingerprint
+
+    def write_atomic(self, path, data):
+        tmp_path = path.with_name(f'.{path.name}.tmp')
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
@@ -1,7 +1,8 @@
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
-from martyrs.models import Martyr
-import requests
-from bs4 import BeautifulSoup
+from martyrs.models import EnrichmentJob, Martyr
+from martyrs.scrape_metrics import ScrapeMetrics
+from martyrs.scraping import DEFAULT_HEADERS, extract_country_from_text, is_good_news
 from datetime import datetime
 from urllib.parse import urljoin
 import re
@@ -17,25 +18,70 @@ class Command(BaseCommand):
             type=str,
             help='Specific source name to scrape (acn, opendoors, csw, release)',
         )
+        parser.add_argument(
+            '--metrics-json',
+            type=str,
+            help='Write per-source metrics as JSON lines to this path ("-" for stdout)',
+        )
+        parser.add_argument(
+            '--prometheus-textfile',
+            type=str,
+            help='Write per-source metrics in Prometheus textfile format to this path',
+        )
+        parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='Run under cProfile and print the hottest functions',
+        )
+        parser.add_argument(
+            '--build-static-site',
+            action='store_true',
+            help='Rebuild the pre-rendered static site after fetching',
+        )
 
     def handle(self, *args, **options):
         self.stdout.write('Starting data fetch...')
         
+        self.metrics = ScrapeMetrics()
+        self.current_source = None
+        
         sources = self.get_scraping_sources()
         
         if options['source']:
             sources = [s for s in sources if s['name'].lower() == options['source'].lower()]
         
+        if options['profile']:
+            import cProfile
+            import io
+            import pstats
+            
+            profiler = cProfile.Profile()
+            profiler.runcall(self.scrape_sources, sources)
+            # pstats prints line by line; OutputWrapper would add a newline
+            # to every write, so collect the report and write it once.
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(25)
+            self.stdout.write(report.getvalue(), ending='')
+        else:
+            self.scrape_sources(sources)
+        
+        self.metrics.write_outputs(options, self.stdout)
+        
+        if options['build_static_site']:
+            call_command('build_static_site', stdout=self.stdout)
+        
+        self.stdout.write(self.style.SUCCESS('Data fetch completed.'))
+
+    def scrape_sources(self, sources):
         for source in sources:
             try:
                 self.scrape_source(source)
                 time.sleep(2)
             except Exception as e:
+                self.metrics.error(source['name'], 'source', e)
                 self.stdout.write(
                     self.style.ERROR(f'Error scraping {source["name"]}: {str(e)}')
                 )
-        
-        self.stdout.write(self.style.SUCCESS('Data fetch completed.'))
 
     def get_scraping_sources(self):
         return [
@@ -72,62 +118,44 @@ class Command(BaseCommand):
         ]
 
     def scrape_source(self, source):
+        # requests and bs4 dominate this module's import time; importing them
+        # here keeps --help and runs that scrape nothing from paying for them.
+        import requests
+        from bs4 import BeautifulSoup
+        
         self.stdout.write(f'Scraping {source["name"]}...')
+        self.current_source = source['name']
         
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(source['url'], headers=headers, timeout=15)
+            start = time.perf_counter()
+            response = requests.get(source['url'], headers=DEFAULT_HEADERS, timeout=15)
             response.raise_for_status()
+            self.metrics.observe_fetch(source['name'], 'listing', time.perf_counter() - start, len(response.content))
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            with self.metrics.stage(source['name'], 'parse'):
+                soup = BeautifulSoup(response.content, 'html.parser')
             parser_method = getattr(self, source['parser'])
-            parser_method(soup, source['url'], source['name'], headers)
+            with self.metrics.stage(source['name'], 'extract'):
+                parser_method(soup, source['url'], source['name'])
                 
         except requests.RequestException as e:
+            self.metrics.error(source['name'], 'fetch', e)
             self.stdout.write(
                 self.style.WARNING(f'Failed to fetch {source["url"]}: {str(e)}')
             )
     
-    def fetch_article_content(self, article_url, headers):
-        try:
-            response = requests.get(article_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            content_selectors = [
-                'article .content',
-                'article .post-content',
-                '.article-content',
-                '.entry-content',
-                'main article',
-                'article',
-                '.content',
-            ]
-            
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    paragraphs = content_elem.find_all('p')
-                    text = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-                    if len(text) > 50:
-                        return text[:1000]
-            
-            paragraphs = soup.find_all('p', limit=10)
-            text = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-            return text[:1000] if text else None
-            
-        except:
-            return None
+    def enqueue_enrichment(self, martyr, title, source_name):
+        EnrichmentJob.objects.create(martyr=martyr, url=martyr.source_url, title=title[:500])
+        self.metrics.incr(source_name, 'enrichment_queued')
 
-    def parse_acn(self, soup, base_url, source_name, headers):
+    def parse_acn(self, soup, base_url, source_name):
         articles = soup.find_all(['article', 'div'], class_=lambda x: x and ('article' in str(x).lower() or 'news' in str(x).lower() or 'post' in str(x).lower()), limit=20)
         
         if not articles:
             articles = soup.select('article, .article, .news-item, .post, [class*="article"], [class*="news"]')[:20]
         
         for article in articles:
+            self.metrics.incr(source_name, 'items_seen')
             try:
                 title_elem = article.find(['h1', 'h2', 'h3', 'h4'], class_=lambda x: x and ('title' in str(x).lower() if x else False))
                 if not title_elem:
@@ -135,6 +163,7 @@ class Command(BaseCommand):
                 
                 title = title_elem.get_text(strip=True) if title_elem else None
                 if not title or len(title) < 5:
+                    self.metrics.incr(source_name, 'items_skipped')
                     continue
                 
                 link_elem = article.find('a', href=True)
@@ -150,38 +179,46 @@ class Command(BaseCommand):
                     if date_elem:
                         date_str = date_elem.strip()
                 
-                date = self.parse_date(date_str) if date_str else datetime.now().date()
+                date = self.parse_date(date_str)
                 
                 desc_elem = article.find(['p', '.excerpt', '.summary', '[class*="excerpt"]', '[class*="summary"]'])
                 description = desc_elem.get_text(strip=True) if desc_elem else title
                 
-                country = self.extract_country_from_text(title + ' ' + description)
+                country = extract_country_from_text(title + ' ' + description)
                 
                 name = self.extract_name_from_title(title)
                 
-                if not Martyr.objects.filter(source_url=article_url).exists():
-                    Martyr.objects.create(
-                        name=name,
-                        country=country,
-                        date=date,
-                        source_url=article_url,
-                        description=description[:1000]
-                    )
+                with self.metrics.stage(source_name, 'db'):
+                    exists = Martyr.objects.filter(source_url=article_url).exists()
+                    if not exists:
+                        Martyr.objects.create(
+                            name=name,
+                            country=country,
+                            date=date,
+                            source_url=article_url,
+                            description=description[:1000]
+                        )
+                if exists:
+                    self.metrics.incr(source_name, 'items_duplicate')
+                else:
+                    self.metrics.incr(source_name, 'items_added')
                     self.stdout.write(f'  Added: {name} - {country}')
                     
             except Exception as e:
+                self.metrics.error(source_name, 'item', e)
                 self.stdout.write(
                     self.style.WARNING(f'  Error parsing ACN article: {str(e)}')
                 )
                 continue
 
-    def parse_opendoors(self, soup, base_url, source_name, headers):
+    def parse_opendoors(self, soup, base_url, source_name):
         articles = soup.find_all(['article', 'div'], class_=lambda x: x and ('story' in str(x).lower() or 'article' in str(x).lower() or 'post' in str(x).lower()), limit=20)
         
         if not articles:
             articles = soup.select('article, .story, .article, .post, [class*="story"], [class*="article"]')[:20]
         
         for article in articles:
+            self.metrics.incr(source_name, 'items_seen')
             try:
                 title_elem = article.find(['h1', 'h2', 'h3', 'h4'], class_=lambda x: x and ('title' in str(x).lower() if x else False))
                 if not title_elem:
@@ -189,6 +226,7 @@ class Command(BaseCommand):
                 
                 title = title_elem.get_text(strip=True) if title_elem else None
                 if not title or len(title) < 5:
+                    self.metrics.incr(source_name, 'items_skipped')
                     continue
                 
                 link_elem = article.find('a', href=True)
@@ -204,52 +242,63 @@ class Command(BaseCommand):
                     if date_elem:
                         date_str = date_elem.strip()
                 
-                date = self.parse_date(date_str) if date_str else datetime.now().date()
+                date = self.parse_date(date_str)
                 
                 desc_elem = article.find(['p', '.excerpt', '.summary', '[class*="excerpt"]', '[class*="summary"]'])
                 description = desc_elem.get_text(strip=True) if desc_elem else ''
                 
-                if article_url != base_url and len(description) < 100:
-                    full_content = self.fetch_article_content(article_url, headers)
-                    if full_content:
-                        description = full_content
+                # Short excerpts are stored as-is and the full article text is
+                # fetched later by process_enrichment_queue.
+                needs_enrichment = article_url != base_url and len(description) < 100
                 
                 if not description:
                     description = title
                 
-                if self.is_good_news(title, description):
+                if is_good_news(title, description):
+                    self.metrics.incr(source_name, 'good_news_filtered')
                     continue
                 
-                country = self.extract_country_from_text(title + ' ' + description)
+                country = extract_country_from_text(title + ' ' + description)
                 
                 name = self.extract_name_from_title(title)
                 
                 if name.lower() in ['news', 'latest', 'update', 'report', 'listen', 'prayer alert'] or len(name) < 5:
+                    self.metrics.incr(source_name, 'items_skipped')
                     continue
                 
-                if not Martyr.objects.filter(source_url=article_url).exists():
-                    Martyr.objects.create(
-                        name=name,
-                        country=country,
-                        date=date,
-                        source_url=article_url,
-                        description=description[:1000]
-                    )
+                with self.metrics.stage(source_name, 'db'):
+                    exists = Martyr.objects.filter(source_url=article_url).exists()
+                    if not exists:
+                        martyr = Martyr.objects.create(
+                            name=name,
+                            country=country,
+                            date=date,
+                            source_url=article_url,
+                            description=description[:1000]
+                        )
+                        if needs_enrichment:
+                            self.enqueue_enrichment(martyr, title, source_name)
+                if exists:
+                    self.metrics.incr(source_name, 'items_duplicate')
+                else:
+                    self.metrics.incr(source_name, 'items_added')
                     self.stdout.write(f'  Added: {name} - {country}')
                     
             except Exception as e:
+                self.metrics.error(source_name, 'item', e)
                 self.stdout.write(
                     self.style.WARNING(f'  Error parsing OpenDoors article: {str(e)}')
                 )
                 continue
 
-    def parse_csw(self, soup, base_url, source_name, headers):
+    def parse_csw(self, soup, base_url, source_name):
         articles = soup.find_all(['article', 'div', 'li'], class_=lambda x: x and ('news' in str(x).lower() or 'article' in str(x).lower() or 'item' in str(x).lower()), limit=20)
         
         if not articles:
             articles = soup.select('article, .news, .article, .item, [class*="news"], [class*="article"]')[:20]
         
         for article in articles:
+            self.metrics.incr(source_name, 'items_seen')
             try:
                 title_elem = article.find(['h1', 'h2', 'h3', 'h4', 'a'], class_=lambda x: x and ('title' in str(x).lower() if x else False))
                 if not title_elem:
@@ -257,6 +306,7 @@ class Command(BaseCommand):
                 
                 title = title_elem.get_text(strip=True) if title_elem else None
                 if not title or len(title) < 5:
+                    self.metrics.incr(source_name, 'items_skipped')
                     continue
                 
                 link_elem = article.find('a', href=True)
@@ -275,52 +325,63 @@ class Command(BaseCommand):
                     if date_elem:
                         date_str = date_elem.strip()
                 
-                date = self.parse_date(date_str) if date_str else datetime.now().date()
+                date = self.parse_date(date_str)
                 
                 desc_elem = article.find(['p', '.excerpt', '.summary', '[class*="excerpt"]', '[class*="summary"]'])
                 description = desc_elem.get_text(strip=True) if desc_elem else ''
                 
-                if article_url != base_url and len(description) < 100:
-                    full_content = self.fetch_article_content(article_url, headers)
-                    if full_content:
-                        description = full_content
+                # Short excerpts are stored as-is and the full article text is
+                # fetched later by process_enrichment_queue.
+                needs_enrichment = article_url != base_url and len(description) < 100
                 
                 if not description:
                     description = title
                 
-                if self.is_good_news(title, description):
+                if is_good_news(title, description):
+                    self.metrics.incr(source_name, 'good_news_filtered')
                     continue
                 
-                country = self.extract_country_from_text(title + ' ' + description)
+                country = extract_country_from_text(title + ' ' + description)
                 
                 name = self.extract_name_from_title(title)
                 
                 if name.lower() in ['news', 'latest', 'update', 'report', 'listen', 'prayer alert'] or len(name) < 5:
+                    self.metrics.incr(source_name, 'items_skipped')
                     continue
                 
-                if not Martyr.objects.filter(source_url=article_url).exists():
-                    Martyr.objects.create(
-                        name=name,
-                        country=country,
-                        date=date,
-                        source_url=article_url,
-                        description=description[:1000]
-                    )
+                with self.metrics.stage(source_name, 'db'):
+                    exists = Martyr.objects.filter(source_url=article_url).exists()
+                    if not exists:
+                        martyr = Martyr.objects.create(
+                            name=name,
+                            country=country,
+                            date=date,
+                            source_url=article_url,
+                            description=description[:1000]
+                        )
+                        if needs_enrichment:
+                            self.enqueue_enrichment(martyr, title, source_name)
+                if exists:
+                    self.metrics.incr(source_name, 'items_duplicate')
+                else:
+                    self.metrics.incr(source_name, 'items_added')
                     self.stdout.write(f'  Added: {name} - {country}')
                     
             except Exception as e:
+                self.metrics.error(source_name, 'item', e)
                 self.stdout.write(
                     self.style.WARNING(f'  Error parsing CSW article: {str(e)}')
                 )
                 continue
 
-    def parse_release(self, soup, base_url, source_name, headers):
+    def parse_release(self, soup, base_url, source_name):
         articles = soup.find_all(['article', 'div'], class_=lambda x: x and ('news' in str(x).lower() or 'article' in str(x).lower() or 'post' in str(x).lower()), limit=20)
         
         if not articles:
             articles = soup.select('article, .news, .article, .post, [class*="news"], [class*="article"]')[:20]
         
         for article in articles:
+            self.metrics.incr(source_name, 'items_seen')
             try:
                 title_elem = article.find(['h1', 'h2', 'h3', 'h4'], class_=lambda x: x and ('title' in str(x).lower() if x else False))
                 if not title_elem:
@@ -328,6 +389,7 @@ class Command(BaseCommand):
                 
                 title = title_elem.get_text(strip=True) if title_elem else None
                 if not title or len(title) < 5:
+                    self.metrics.incr(source_name, 'items_skipped')
                     continue
                 
                 link_elem = article.find('a', href=True)
@@ -343,52 +405,63 @@ class Command(BaseCommand):
                     if date_elem:
                         date_str = date_elem.strip()
                 
-                date = self.parse_date(date_str) if date_str else datetime.now().date()
+                date = self.parse_date(date_str)
                 
                 desc_elem = article.find(['p', '.excerpt', '.summary', '[class*="excerpt"]', '[class*="summary"]'])
                 description = desc_elem.get_text(strip=True) if desc_elem else ''
                 
-                if article_url != base_url and len(description) < 100:
-                    full_content = self.fetch_article_content(article_url, headers)
-                    if full_content:
-                        description = full_content
+                # Short excerpts are stored as-is and the full article text is
+                # fetched later by process_enrichment_queue.
+                needs_enrichment = article_url != base_url and len(description) < 100
                 
                 if not description:
                     description = title
                 
-                if self.is_good_news(title, description):
+                if is_good_news(title, description):
+                    self.metrics.incr(source_name, 'good_news_filtered')
                     continue
                 
-                country = self.extract_country_from_text(title + ' ' + description)
+                country = extract_country_from_text(title + ' ' + description)
                 
                 name = self.extract_name_from_title(title)
                 
                 if name.lower() in ['news', 'latest', 'update', 'report', 'listen', 'prayer alert'] or len(name) < 5:
+                    self.metrics.incr(source_name, 'items_skipped')
                     continue
                 
-                if not Martyr.objects.filter(source_url=article_url).exists():
-                    Martyr.objects.create(
-                        name=name,
-                        country=country,
-                        date=date,
-                        source_url=article_url,
-                        description=description[:1000]
-                    )
+                with self.metrics.stage(source_name, 'db'):
+                    exists = Martyr.objects.filter(source_url=article_url).exists()
+                    if not exists:
+                        martyr = Martyr.objects.create(
+                            name=name,
+                            country=country,
+                            date=date,
+                            source_url=article_url,
+                            description=description[:1000]
+                        )
+                        if needs_enrichment:
+                            self.enqueue_enrichment(martyr, title, source_name)
+                if exists:
+                    self.metrics.incr(source_name, 'items_duplicate')
+                else:
+                    self.metrics.incr(source_name, 'items_added')
                     self.stdout.write(f'  Added: {name} - {country}')
                     
             except Exception as e:
+                self.metrics.error(source_name, 'item', e)
                 self.stdout.write(
                     self.style.WARNING(f'  Error parsing Release International article: {str(e)}')
                 )
                 continue
 
-    def parse_generic(self, soup, base_url, source_name, headers):
+    def parse_generic(self, soup, base_url, source_name):
         articles = soup.find_all(['article', 'div'], class_=lambda x: x and ('article' in str(x).lower() or 'news' in str(x).lower() or 'post' in str(x).lower() or 'story' in str(x).lower()), limit=20)
         
         if not articles:
             articles = soup.select('article, .article, .news-item, .post, .story, [class*="article"], [class*="news"]')[:20]
         
         for article in articles:
+            self.metrics.incr(source_name, 'items_seen')
             try:
                 title_elem = article.find(['h1', 'h2', 'h3', 'h4'], class_=lambda x: x and ('title' in str(x).lower() if x else False))
                 if not title_elem:
@@ -396,9 +469,11 @@ class Command(BaseCommand):
                 
                 title = title_elem.get_text(strip=True) if title_elem else None
                 if not title or len(title) < 10:
+                    self.metrics.incr(source_name, 'items_skipped')
                     continue
                 
-                if self.is_good_news(title, ''):
+                if is_good_news(title, ''):
+                    self.metrics.incr(source_name, 'good_news_filtered')
                     continue
                 
                 link_elem = article.find('a', href=True)
@@ -414,93 +489,55 @@ class Command(BaseCommand):
                     if date_elem:
                         date_str = date_elem.strip()
                 
-                date = self.parse_date(date_str) if date_str else datetime.now().date()
+                date = self.parse_date(date_str)
                 
                 desc_elem = article.find(['p', '.excerpt', '.summary', '[class*="excerpt"]', '[class*="summary"]'])
                 description = desc_elem.get_text(strip=True) if desc_elem else ''
                 
-                if article_url != base_url and len(description) < 100:
-                    full_content = self.fetch_article_content(article_url, headers)
-                    if full_content:
-                        description = full_content
+                # Short excerpts are stored as-is and the full article text is
+                # fetched later by process_enrichment_queue.
+                needs_enrichment = article_url != base_url and len(description) < 100
                 
                 if not description:
                     description = title
                 
-                if self.is_good_news(title, description):
+                if is_good_news(title, description):
+                    self.metrics.incr(source_name, 'good_news_filtered')
                     continue
                 
-                country = self.extract_country_from_text(title + ' ' + description)
+                country = extract_country_from_text(title + ' ' + description)
                 
                 name = self.extract_name_from_title(title)
                 
                 if name.lower() in ['news', 'latest', 'update', 'report', 'listen', 'prayer alert'] or len(name) < 5:
+                    self.metrics.incr(source_name, 'items_skipped')
                     continue
                 
-                if not Martyr.objects.filter(source_url=article_url).exists():
-                    Martyr.objects.create(
-                        name=name,
-                        country=country,
-                        date=date,
-                        source_url=article_url,
-                        description=description[:1000]
-                    )
+                with self.metrics.stage(source_name, 'db'):
+                    exists = Martyr.objects.filter(source_url=article_url).exists()
+                    if not exists:
+                        martyr = Martyr.objects.create(
+                            name=name,
+                            country=country,
+                            date=date,
+                            source_url=article_url,
+                            description=description[:1000]
+                        )
+                        if needs_enrichment:
+                            self.enqueue_enrichment(martyr, title, source_name)
+                if exists:
+                    self.metrics.incr(source_name, 'items_duplicate')
+                else:
+                    self.metrics.incr(source_name, 'items_added')
                     self.stdout.write(f'  Added: {name} - {country}')
                     
             except Exception as e:
+                self.metrics.error(source_name, 'item', e)
                 self.stdout.write(
                     self.style.WARNING(f'  Error parsing {source_name} article: {str(e)}')
                 )
                 continue
 
-    def is_good_news(self, title, description):
-        good_news_keywords = [
-            'released', 'freed', 'acquitted', 'exonerated', 'cleared',
-            'rejoice', 'celebration', 'victory', 'success', 'good news',
-            'thankful', 'grateful', 'praise god', 'answered prayer',
-            'coming out of prison', 'set free', 'liberated'
-        ]
-        
-        combined_text = (title + ' ' + description).lower()
-        for keyword in good_news_keywords:
-            if keyword in combined_text:
-                return True
-        return False
-
-    def extract_country_from_text(self, text):
-        countries = [
-            'North Korea', 'Saudi Arabia', 'United Arab Emirates', 'Central African Republic',
-            'Democratic Republic of Congo', 'South Africa', 'French Guiana',
-            'Nigeria', 'Pakistan', 'India', 'China', 'Afghanistan',
-            'Somalia', 'Libya', 'Yemen', 'Eritrea', 'Sudan', 'Iraq', 'Syria',
-            'Iran', 'Egypt', 'Bangladesh', 'Vietnam', 'Myanmar', 'Laos',
-            'Maldives', 'Turkmenistan', 'Uzbekistan', 'Kazakhstan',
-            'Tajikistan', 'Nepal', 'Bhutan', 'Sri Lanka', 'Indonesia', 'Malaysia',
-            'Brunei', 'Turkey', 'Azerbaijan', 'Algeria', 'Tunisia', 'Morocco',
-            'Mauritania', 'Mali', 'Niger', 'Chad', 'Ethiopia', 'Kenya', 'Tanzania',
-            'Uganda', 'Rwanda', 'Burundi', 'Cameroon',
-            'Congo', 'Angola', 'Mozambique',
-            'Zimbabwe', 'Botswana', 'Namibia', 'Madagascar',
-            'Comoros', 'Djibouti', 'Lebanon', 'Jordan', 'Palestine', 'Israel',
-            'Qatar', 'Kuwait', 'Bahrain', 'Oman',
-            'Philippines', 'Thailand', 'Cambodia', 'Mongolia', 'Russia',
-            'Ukraine', 'Belarus', 'Kyrgyzstan', 'Armenia', 'Georgia',
-            'Albania', 'Bosnia', 'Serbia', 'Croatia', 'Bulgaria', 'Romania',
-            'Greece', 'Cyprus', 'Malta', 'Venezuela', 'Colombia', 'Peru',
-            'Ecuador', 'Bolivia', 'Paraguay', 'Brazil', 'Argentina', 'Chile',
-            'Uruguay', 'Mexico', 'Guatemala', 'Honduras', 'El Salvador',
-            'Nicaragua', 'Costa Rica', 'Panama', 'Cuba', 'Haiti', 'Jamaica',
-            'Trinidad', 'Guyana', 'Suriname'
-        ]
-        
-        text_lower = ' ' + text.lower() + ' '
-        for country in countries:
-            country_lower = country.lower()
-            if ' ' + country_lower + ' ' in text_lower or text_lower.startswith(country_lower + ' ') or text_lower.endswith(' ' + country_lower):
-                return country
-        
-        return 'Unknown'
-
     def extract_name_from_title(self, title):
         generic_words = {'news', 'latest', 'update', 'report', 'story', 'article', 
                         'persecution', 'christian', 'church', 'pastor', 'priest',
@@ -535,6 +572,7 @@ class Command(BaseCommand):
 
     def parse_date(self, date_str):
         if not date_str:
+            self.metrics.incr(self.current_source, 'date_fallbacks')
             return datetime.now().date()
         
         date_str = date_str.strip()
@@ -556,7 +594,7 @@ class Command(BaseCommand):
         for fmt in formats:
             try:
                 return datetime.strptime(date_str[:19], fmt).date()
-            except:
+            except ValueError:
                 continue
         
         match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})', date_str)
@@ -566,7 +604,8 @@ class Command(BaseCommand):
                 year = '20' + year if int(year) < 50 else '19' + year
             try:
                 return datetime(int(year), int(month), int(day)).date()
-            except:
+            except ValueError:
                 pass
         
+        self.metrics.incr(self.current_source, 'date_fallbacks')
         return datetime.now().date()
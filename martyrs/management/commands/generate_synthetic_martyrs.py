@@ -0,0 +1,118 @@
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from martyrs.models import Martyr
+from martyrs.signals import invalidate_count_cache, invalidate_country_list, invalidate_feed_cache
+
+
+SYNTHETIC_URL_PREFIX = 'https://synthetic.invalid/martyrs/'
+
+# Used when the database holds no real rows to sample a distribution from.
+DEFAULT_COUNTRIES = {
+    'Nigeria': 30, 'India': 12, 'China': 10, 'Pakistan': 10, 'Turkey': 6,
+    'Syria': 5, 'Oman': 4, 'Malaysia': 3, 'Kyrgyzstan': 3, 'Unknown': 17,
+}
+DEFAULT_DESCRIPTION_LENGTHS = [117, 420, 760, 1000, 1000, 1000]
+
+FIRST_NAMES = [
+    'John', 'Mary', 'Joseph', 'Grace', 'Peter', 'Esther', 'Paul', 'Ruth',
+    'Samuel', 'Deborah', 'Emmanuel', 'Blessing', 'Daniel', 'Sarah', 'Musa', 'Aisha',
+]
+LAST_NAMES = [
+    'Adebayo', 'Okafor', 'Bulus', 'Masih', 'Khan', 'Li', 'Wang', 'Yusuf',
+    'Gyang', 'Danjuma', 'Bhatti', 'Kumar', 'Chen', 'Haddad', 'Demir', 'Tan',
+]
+WORDS = (
+    'gunmen attacked the village church during sunday service killing several '
+    'worshippers and abducting others local leaders said security forces arrived '
+    'hours later pastor family community prayer faith believers persecution '
+    'arrested detained charged blasphemy court hearing adjourned authorities '
+    'raided house gathering congregation displaced homes burned region state'
+).split()
+
+
+class Command(BaseCommand):
+    help = (
+        'Fill the database with synthetic martyrs for load testing. Countries, dates '
+        'and description lengths are sampled from the existing rows.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('count', type=int, help='Number of rows to insert')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=0, help='Random seed for reproducible data')
+        parser.add_argument(
+            '--delete',
+            action='store_true',
+            help='Delete previously generated synthetic rows before inserting',
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+
+        if options['delete']:
+            deleted, _ = Martyr.objects.filter(source_url__startswith=SYNTHETIC_URL_PREFIX).delete()
+            self.stdout.write(f'Deleted {deleted} synthetic rows')
+
+        countries, dates, lengths = self.sample_distribution()
+        country_names = list(countries)
+        country_weights = list(countries.values())
+        # Spread sampled dates so a large table doesn't pile onto a few days.
+        jitter = max(1, (max(dates) - min(dates)).days // max(1, len(dates)))
+        # Building text word by word per row dominates insert time, so rows
+        # take prefixes of a pool of pre-generated descriptions.
+        texts = [self.description(rng, max(lengths)) for _ in range(500)]
+        start_id = Martyr.objects.filter(source_url__startswith=SYNTHETIC_URL_PREFIX).count()
+
+        inserted = 0
+        with transaction.atomic():
+            while inserted < options['count']:
+                size = min(options['batch_size'], options['count'] - inserted)
+                batch = []
+                for n in range(start_id + inserted, start_id + inserted + size):
+                    batch.append(Martyr(
+                        name=f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+                        country=rng.choices(country_names, country_weights)[0],
+                        date=rng.choice(dates) - timedelta(days=rng.randint(0, jitter)),
+                        source_url=f'{SYNTHETIC_URL_PREFIX}{n}',
+                        description=rng.choice(texts)[:rng.choice(lengths)].rstrip(),
+                    ))
+                Martyr.objects.bulk_create(batch)
+                inserted += size
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+        # bulk_create bypasses post_save, so invalidate the caches by hand.
+        invalidate_count_cache(Martyr)
+        invalidate_country_list(Martyr)
+        invalidate_feed_cache(Martyr)
+
+        self.stdout.write(self.style.SUCCESS(f'Inserted {inserted} synthetic martyrs'))
+
+    def sample_distribution(self):
+        rows = list(
+            Martyr.objects.exclude(source_url__startswith=SYNTHETIC_URL_PREFIX)
+            .values_list('country', 'date', 'description')
+        )
+        if not rows:
+            today = date.today()
+            return DEFAULT_COUNTRIES, [today - timedelta(days=d) for d in range(0, 180, 7)], DEFAULT_DESCRIPTION_LENGTHS
+        countries = Counter(country for country, _, _ in rows)
+        dates = [row_date for _, row_date, _ in rows]
+        lengths = [len(description) for _, _, description in rows]
+        return countries, dates, lengths
+
+    def description(self, rng, length):
+        words = []
+        total = 0
+        while total < length:
+            word = rng.choice(WORDS)
+            words.append(word)
+            total += len(word) + 1
+        text = ' '.join(words)[:length].rstrip()
+        return text[:1].upper() + text[1:]
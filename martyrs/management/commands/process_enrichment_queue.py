@@ -0,0 +1,157 @@
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from martyrs.models import EnrichmentJob
+from martyrs.scrape_metrics import ScrapeMetrics
+from martyrs.scraping import extract_country_from_text, fetch_article_content, is_good_news
+
+
+# Metrics source label for everything the worker fetches.
+SOURCE = 'Enrichment'
+
+MAX_ATTEMPTS = 3
+
+# A failed fetch waits RETRY_BACKOFF, then twice that, and so on.
+RETRY_BACKOFF = timedelta(minutes=5)
+
+# Jobs left running this long are assumed to belong to a worker that died.
+STALE_AFTER = timedelta(minutes=10)
+
+# complete_job() outcomes besides the job statuses.
+ENRICHED = 'enriched'
+FILTERED = 'filtered'
+
+
+class Command(BaseCommand):
+    help = 'Fetch full article text for queued martyrs and update their description and country'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Number of articles to fetch in parallel',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=20,
+            help='Number of jobs to claim at a time',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when no job is due instead of polling',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=30.0,
+            help='Seconds to wait between polls when the queue is empty',
+        )
+        parser.add_argument(
+            '--metrics-json',
+            type=str,
+            help='Write fetch metrics as JSON lines to this path ("-" for stdout) when the worker exits',
+        )
+        parser.add_argument(
+            '--prometheus-textfile',
+            type=str,
+            help='Write fetch metrics in Prometheus textfile format to this path after every batch',
+        )
+        parser.add_argument(
+            '--build-static-site',
+            action='store_true',
+            help='Rebuild the pre-rendered static site after every batch that changed a martyr',
+        )
+
+    def handle(self, *args, **options):
+        self.metrics = ScrapeMetrics()
+
+        outcomes = Counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            while True:
+                close_old_connections()
+                # Checked on every poll so a long-running worker also picks up
+                # jobs left behind by a sibling that died.
+                self.requeue_stale_jobs()
+                jobs = self.claim_jobs(options['batch_size'])
+                if not jobs:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                results = pool.map(lambda job: fetch_article_content(job.url, self.metrics, SOURCE), jobs)
+                changed = 0
+                for job, content in zip(jobs, results):
+                    outcome = self.complete_job(job, content)
+                    outcomes[outcome] += 1
+                    if outcome in (ENRICHED, FILTERED):
+                        changed += 1
+
+                if options['prometheus_textfile']:
+                    self.metrics.write_prometheus_textfile(options['prometheus_textfile'])
+                if changed and options['build_static_site']:
+                    call_command('build_static_site', stdout=self.stdout)
+
+        self.metrics.write_outputs(options, self.stdout)
+        self.stdout.write(self.style.SUCCESS(
+            f'Enrichment finished: {outcomes[ENRICHED]} enriched, '
+            f'{outcomes[FILTERED]} filtered as good news, {outcomes[EnrichmentJob.FAILED]} failed'
+        ))
+
+    def requeue_stale_jobs(self):
+        requeued = EnrichmentJob.objects.filter(
+            status=EnrichmentJob.RUNNING,
+            updated_at__lt=timezone.now() - STALE_AFTER,
+        ).update(status=EnrichmentJob.PENDING, updated_at=timezone.now())
+        if requeued:
+            self.stdout.write(f'Requeued {requeued} stale jobs')
+
+    def claim_jobs(self, batch_size):
+        candidates = EnrichmentJob.objects.filter(
+            status=EnrichmentJob.PENDING,
+            next_attempt_at__lte=timezone.now(),
+        ).values_list('pk', flat=True)[:batch_size]
+        claimed = []
+        for pk in candidates:
+            # The conditional update is the lock: only one worker can move a
+            # job out of pending.
+            if EnrichmentJob.objects.filter(pk=pk, status=EnrichmentJob.PENDING).update(
+                status=EnrichmentJob.RUNNING, updated_at=timezone.now()
+            ):
+                claimed.append(pk)
+        return list(EnrichmentJob.objects.filter(pk__in=claimed).select_related('martyr'))
+
+    def complete_job(self, job, content):
+        """Apply a fetched article to the job's martyr and return the outcome."""
+        job.attempts += 1
+        if content:
+            martyr = job.martyr
+            # The listing excerpt was too short to tell; the article may
+            # report a release rather than a persecution.
+            if is_good_news(job.title, content):
+                self.metrics.incr(SOURCE, 'good_news_filtered')
+                martyr.delete()
+                self.stdout.write(f'  Filtered (good news): {martyr.name}')
+                return FILTERED
+            martyr.description = content[:1000]
+            martyr.country = extract_country_from_text(job.title + ' ' + content)
+            martyr.save(update_fields=['description', 'country', 'updated_at'])
+            job.status = EnrichmentJob.DONE
+            self.stdout.write(f'  Enriched: {martyr.name} - {martyr.country}')
+        elif job.attempts >= MAX_ATTEMPTS:
+            job.status = EnrichmentJob.FAILED
+        else:
+            job.status = EnrichmentJob.PENDING
+            job.next_attempt_at = timezone.now() + RETRY_BACKOFF * 2 ** (job.attempts - 1)
+        job.save(update_fields=['status', 'attempts', 'next_attempt_at', 'updated_at'])
+        return ENRICHED if job.status == EnrichmentJob.DONE else job.status
@@ -0,0 +1,135 @@
+import logging
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+
+logger = logging.getLogger('martyrs.performance')
+
+_current_metrics = ContextVar('martyrs_request_metrics', default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.query_count = 0
+        self.db_time = 0.0
+        self.view_start = None
+        self.view_time = None
+        self.render_start = None
+        self.render_time = None
+
+
+def record_query(execute, sql, params, many, context):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_time += time.perf_counter() - start
+        metrics.query_count += 1
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    # The async ORM runs queries on a worker thread with its own connection,
+    # so the wrapper is installed on every connection and finds the current
+    # request's metrics through a context variable rather than being tied to
+    # the connection the middleware happens to see.
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
+
+
+class PerformanceMiddleware:
+    """
+    Records query count, DB time, view time and template render time for
+    each request and reports them in a Server-Timing header and a sampled log.
+
+    DB time overlaps view and render time because querysets handed to a
+    template are only evaluated while it renders.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.server_timing = getattr(settings, 'PERFORMANCE_SERVER_TIMING', True)
+        self.log_sample_rate = getattr(settings, 'PERFORMANCE_LOG_SAMPLE_RATE', 0.0)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        request.performance_metrics = metrics
+        token = _current_metrics.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        request.performance_metrics = metrics
+        token = _current_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        now = time.perf_counter()
+        if metrics.view_start is not None and metrics.view_time is None:
+            metrics.view_time = now - metrics.view_start
+        total_time = now - metrics.start
+
+        if self.server_timing:
+            response['Server-Timing'] = self.format_server_timing(metrics, total_time)
+
+        if self.log_sample_rate and random.random() < self.log_sample_rate:
+            logger.info(
+                '%s %s status=%s queries=%d db_ms=%.1f view_ms=%.1f render_ms=%.1f total_ms=%.1f',
+                request.method,
+                request.path,
+                response.status_code,
+                metrics.query_count,
+                metrics.db_time * 1000,
+                (metrics.view_time or 0) * 1000,
+                (metrics.render_time or 0) * 1000,
+                total_time * 1000,
+            )
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.performance_metrics.view_start = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        metrics = request.performance_metrics
+        metrics.render_start = time.perf_counter()
+        if metrics.view_start is not None:
+            metrics.view_time = metrics.render_start - metrics.view_start
+        response.add_post_render_callback(self.render_finished(metrics))
+        return response
+
+    def render_finished(self, metrics):
+        def callback(response):
+            metrics.render_time = time.perf_counter() - metrics.render_start
+        return callback
+
+    def format_server_timing(self, metrics, total_time):
+        entries = [f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.query_count} queries"']
+        if metrics.view_time is not None:
+            entries.append(f'view;dur={metrics.view_time * 1000:.1f}')
+        if metrics.render_time is not None:
+            entries.append(f'render;dur={metrics.render_time * 1000:.1f}')
+        entries.append(f'total;dur={total_time * 1000:.1f}')
+        return ', '.join(entries)
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('martyrs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='martyr',
+            name='country',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='martyr',
+            name='date',
+            field=models.DateField(db_index=True),
+        ),
+    ]
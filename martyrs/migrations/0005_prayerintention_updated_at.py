@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:49
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('martyrs', '0004_martyr_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='prayerintention',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:51
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('martyrs', '0005_prayerintention_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='enrichmentjob',
+            name='martyrs_enr_status_58039f_idx',
+        ),
+        migrations.AddField(
+            model_name='enrichmentjob',
+            name='next_attempt_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddIndex(
+            model_name='enrichmentjob',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='martyrs_enr_status_faf6ae_idx'),
+        ),
+    ]
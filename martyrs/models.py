@@ -1,13 +1,15 @@
 from django.db import models
+from django.utils import timezone
 
 
 class Martyr(models.Model):
     name = models.CharField(max_length=200)
-    country = models.CharField(max_length=100)
-    date = models.DateField()
+    country = models.CharField(max_length=100, db_index=True)
+    date = models.DateField(db_index=True)
     source_url = models.URLField()
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-date']
@@ -21,6 +23,7 @@ class PrayerIntention(models.Model):
     title = models.CharField(max_length=200)
     details = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
@@ -28,3 +31,35 @@ class PrayerIntention(models.Model):
 
     def __str__(self):
         return self.title
+
+
+class EnrichmentJob(models.Model):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+
+    martyr = models.ForeignKey(Martyr, on_delete=models.CASCADE, related_name='enrichment_jobs')
+    url = models.URLField()
+    title = models.CharField(max_length=500)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['created_at']
+        verbose_name_plural = 'Enrichment Jobs'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.url} ({self.status})"
@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from uuid import uuid4
+
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0)
+
+
+class ScrapeMetrics:
+    """
+    Per-source counters, stage timings and fetch latency histograms for a
+    scrape run. Safe to update from several fetch threads at once.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Tags every JSON record so appended runs can be told apart.
+        self.run_id = uuid4().hex
+        self.counters = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.stage_seconds = defaultdict(float)
+        self.fetch_buckets = defaultdict(lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+        self.fetch_sum = defaultdict(float)
+        self.fetch_count = defaultdict(int)
+        self.fetch_bytes = defaultdict(int)
+
+    def incr(self, source, name, amount=1):
+        with self.lock:
+            self.counters[(source, name)] += amount
+
+    def error(self, source, stage, exc):
+        with self.lock:
+            self.errors[(source, stage, type(exc).__name__)] += 1
+
+    @contextmanager
+    def stage(self, source, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.stage_seconds[(source, stage)] += elapsed
+
+    def observe_fetch(self, source, kind, seconds, nbytes):
+        key = (source, kind)
+        with self.lock:
+            buckets = self.fetch_buckets[key]
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    buckets[i] += 1
+                    break
+            else:
+                buckets[-1] += 1
+            self.fetch_sum[key] += seconds
+            self.fetch_count[key] += 1
+            self.fetch_bytes[key] += nbytes
+
+    def records(self):
+        ts = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with self.lock:
+            return [{'ts': ts, 'run_id': self.run_id, **record} for record in self._records()]
+
+    def _records(self):
+        for (source, name), value in sorted(self.counters.items()):
+            yield {'type': 'counter', 'source': source, 'name': name, 'value': value}
+        for (source, stage, error_type), value in sorted(self.errors.items()):
+            yield {'type': 'error', 'source': source, 'stage': stage, 'error': error_type, 'value': value}
+        for (source, stage), seconds in sorted(self.stage_seconds.items()):
+            yield {'type': 'stage', 'source': source, 'stage': stage, 'seconds': round(seconds, 6)}
+        for (source, kind), buckets in sorted(self.fetch_buckets.items()):
+            yield {
+                'type': 'fetch',
+                'source': source,
+                'kind': kind,
+                'count': self.fetch_count[(source, kind)],
+                'seconds_sum': round(self.fetch_sum[(source, kind)], 6),
+                'bytes': self.fetch_bytes[(source, kind)],
+                'buckets': dict(zip([str(b) for b in LATENCY_BUCKETS] + ['+Inf'], buckets)),
+            }
+
+    def write_json_lines(self, stream):
+        for record in self.records():
+            stream.write(json.dumps(record, sort_keys=True) + '\n')
+
+    def prometheus_text(self):
+        with self.lock:
+            return self._prometheus_text()
+
+    def _prometheus_text(self):
+        lines = ['# TYPE martyrs_scrape_items_total counter']
+        for (source, name), value in sorted(self.counters.items()):
+            lines.append(f'martyrs_scrape_items_total{{source="{source}",name="{name}"}} {value}')
+
+        lines.append('# TYPE martyrs_scrape_errors_total counter')
+        for (source, stage, error_type), value in sorted(self.errors.items()):
+            lines.append(
+                f'martyrs_scrape_errors_total{{source="{source}",stage="{stage}",error="{error_type}"}} {value}'
+            )
+
+        lines.append('# TYPE martyrs_scrape_stage_seconds gauge')
+        for (source, stage), seconds in sorted(self.stage_seconds.items()):
+            lines.append(f'martyrs_scrape_stage_seconds{{source="{source}",stage="{stage}"}} {seconds:.6f}')
+
+        lines.append('# TYPE martyrs_scrape_fetch_bytes_total counter')
+        for (source, kind), nbytes in sorted(self.fetch_bytes.items()):
+            lines.append(f'martyrs_scrape_fetch_bytes_total{{source="{source}",kind="{kind}"}} {nbytes}')
+
+        lines.append('# TYPE martyrs_scrape_fetch_seconds histogram')
+        for (source, kind), buckets in sorted(self.fetch_buckets.items()):
+            labels = f'source="{source}",kind="{kind}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, buckets):
+                cumulative += count
+                lines.append(f'martyrs_scrape_fetch_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            cumulative += buckets[-1]
+            lines.append(f'martyrs_scrape_fetch_seconds_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f'martyrs_scrape_fetch_seconds_sum{{{labels}}} {self.fetch_sum[(source, kind)]:.6f}')
+            lines.append(f'martyrs_scrape_fetch_seconds_count{{{labels}}} {self.fetch_count[(source, kind)]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write_outputs(self, options, stdout):
+        """Write the files asked for by a command's --metrics-json and --prometheus-textfile."""
+        if options['metrics_json'] == '-':
+            self.write_json_lines(stdout)
+        elif options['metrics_json']:
+            with open(options['metrics_json'], 'a') as f:
+                self.write_json_lines(f)
+
+        if options['prometheus_textfile']:
+            self.write_prometheus_textfile(options['prometheus_textfile'])
+
+    def write_prometheus_textfile(self, path):
+        # node_exporter may read the file at any moment, so write then rename.
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
@@ -0,0 +1,142 @@
+"""
+Helpers shared by the scraping commands: fetching article body text and
+classifying scraped items.
+"""
+import codecs
+import re
+import time
+
+from .article_text import ArticleTextParser
+
+
+HTML_CONTENT_TYPES = {'text/html', 'application/xhtml+xml'}
+
+# Article pages are streamed and parsed as they arrive; nothing past this
+# many bytes is downloaded even if the body text has not been found yet.
+ARTICLE_MAX_BYTES = 512 * 1024
+ARTICLE_CHUNK_SIZE = 16 * 1024
+
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">,
+# which browsers and BeautifulSoup honour when the header names no charset.
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+GOOD_NEWS_KEYWORDS = [
+    'released', 'freed', 'acquitted', 'exonerated', 'cleared',
+    'rejoice', 'celebration', 'victory', 'success', 'good news',
+    'thankful', 'grateful', 'praise god', 'answered prayer',
+    'coming out of prison', 'set free', 'liberated'
+]
+
+COUNTRIES = [
+    'North Korea', 'Saudi Arabia', 'United Arab Emirates', 'Central African Republic',
+    'Democratic Republic of Congo', 'South Africa', 'French Guiana',
+    'Nigeria', 'Pakistan', 'India', 'China', 'Afghanistan',
+    'Somalia', 'Libya', 'Yemen', 'Eritrea', 'Sudan', 'Iraq', 'Syria',
+    'Iran', 'Egypt', 'Bangladesh', 'Vietnam', 'Myanmar', 'Laos',
+    'Maldives', 'Turkmenistan', 'Uzbekistan', 'Kazakhstan',
+    'Tajikistan', 'Nepal', 'Bhutan', 'Sri Lanka', 'Indonesia', 'Malaysia',
+    'Brunei', 'Turkey', 'Azerbaijan', 'Algeria', 'Tunisia', 'Morocco',
+    'Mauritania', 'Mali', 'Niger', 'Chad', 'Ethiopia', 'Kenya', 'Tanzania',
+    'Uganda', 'Rwanda', 'Burundi', 'Cameroon',
+    'Congo', 'Angola', 'Mozambique',
+    'Zimbabwe', 'Botswana', 'Namibia', 'Madagascar',
+    'Comoros', 'Djibouti', 'Lebanon', 'Jordan', 'Palestine', 'Israel',
+    'Qatar', 'Kuwait', 'Bahrain', 'Oman',
+    'Philippines', 'Thailand', 'Cambodia', 'Mongolia', 'Russia',
+    'Ukraine', 'Belarus', 'Kyrgyzstan', 'Armenia', 'Georgia',
+    'Albania', 'Bosnia', 'Serbia', 'Croatia', 'Bulgaria', 'Romania',
+    'Greece', 'Cyprus', 'Malta', 'Venezuela', 'Colombia', 'Peru',
+    'Ecuador', 'Bolivia', 'Paraguay', 'Brazil', 'Argentina', 'Chile',
+    'Uruguay', 'Mexico', 'Guatemala', 'Honduras', 'El Salvador',
+    'Nicaragua', 'Costa Rica', 'Panama', 'Cuba', 'Haiti', 'Jamaica',
+    'Trinidad', 'Guyana', 'Suriname'
+]
+
+
+def fetch_article_content(article_url, metrics, source_name, headers=DEFAULT_HEADERS):
+    """
+    Body text of an article page, or None if it could not be fetched.
+
+    The page is streamed through ArticleTextParser and the download stops
+    as soon as enough text has been found. Counters, errors and timings go
+    to ``metrics`` under ``source_name``.
+    """
+    import requests
+
+    try:
+        start = time.perf_counter()
+        with requests.get(article_url, headers=headers, timeout=10, stream=True) as response:
+            response.raise_for_status()
+
+            content_type_header = response.headers.get('Content-Type', '').lower()
+            content_type = content_type_header.split(';')[0].strip()
+            if content_type and content_type not in HTML_CONTENT_TYPES:
+                metrics.incr(source_name, 'articles_non_html')
+                return None
+
+            # requests assumes ISO-8859-1 for text/* without a charset, so
+            # only trust response.encoding when the header names one.
+            declared = response.encoding if 'charset=' in content_type_header else None
+
+            parser = ArticleTextParser(limit=1000)
+            decoder = None
+            received = 0
+            for chunk in response.iter_content(chunk_size=ARTICLE_CHUNK_SIZE):
+                received += len(chunk)
+                if decoder is None:
+                    # Otherwise look for a <meta> charset near the top of the
+                    # page; without one, UTF-8 is by far the most likely.
+                    encoding = declared or sniff_meta_charset(chunk) or 'utf-8'
+                    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+                with metrics.stage(source_name, 'article_parse'):
+                    parser.feed(decoder.decode(chunk))
+                if parser.done:
+                    metrics.incr(source_name, 'articles_stopped_early')
+                    break
+                if received >= ARTICLE_MAX_BYTES:
+                    metrics.incr(source_name, 'articles_truncated')
+                    break
+
+        metrics.observe_fetch(source_name, 'article', time.perf_counter() - start, received)
+        with metrics.stage(source_name, 'article_parse'):
+            if decoder is not None:
+                parser.feed(decoder.decode(b'', final=True))
+            parser.close()
+            return parser.text()
+
+    except Exception as e:
+        metrics.error(source_name, 'article', e)
+        return None
+
+
+def sniff_meta_charset(head):
+    """Encoding named by a <meta> tag in the first bytes of a page, if it is a known codec."""
+    match = META_CHARSET_RE.search(head, 0, 4096)
+    if match is None:
+        return None
+    try:
+        return codecs.lookup(match.group(1).decode('ascii')).name
+    except LookupError:
+        return None
+
+
+def is_good_news(title, description):
+    combined_text = (title + ' ' + description).lower()
+    for keyword in GOOD_NEWS_KEYWORDS:
+        if keyword in combined_text:
+            return True
+    return False
+
+
+def extract_country_from_text(text):
+    text_lower = ' ' + text.lower() + ' '
+    for country in COUNTRIES:
+        country_lower = country.lower()
+        if ' ' + country_lower + ' ' in text_lower or text_lower.startswith(country_lower + ' ') or text_lower.endswith(' ' + country_lower):
+            return country
+
+    return 'Unknown'
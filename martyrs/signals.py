@@ -0,0 +1,46 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Martyr, PrayerIntention
+
+
+# Writes bump a model's feed version immediately; the timeout bounds how
+# long a bulk write that skips signals and invalidate_feed_cache() can go
+# unnoticed.
+FEED_CACHE_TIMEOUT = 3600
+
+COUNTRY_LIST_KEY = 'martyrs:countries'
+
+COUNTRY_LIST_TIMEOUT = 3600
+
+
+def count_cache_key(model):
+    return f'martyrs:count:{model._meta.label_lower}'
+
+
+def feed_version_key(model):
+    return f'martyrs:feed-version:{model._meta.label_lower}'
+
+
+def feed_cache_version(model):
+    return cache.get_or_set(feed_version_key(model), lambda: uuid4().hex, FEED_CACHE_TIMEOUT)
+
+
+@receiver([post_save, post_delete], sender=Martyr)
+@receiver([post_save, post_delete], sender=PrayerIntention)
+def invalidate_count_cache(sender, **kwargs):
+    cache.delete(count_cache_key(sender))
+
+
+@receiver([post_save, post_delete], sender=Martyr)
+def invalidate_country_list(sender, **kwargs):
+    cache.delete(COUNTRY_LIST_KEY)
+
+
+@receiver([post_save, post_delete], sender=Martyr)
+@receiver([post_save, post_delete], sender=PrayerIntention)
+def invalidate_feed_cache(sender, **kwargs):
+    cache.set(feed_version_key(sender), uuid4().hex, FEED_CACHE_TIMEOUT)
@@ -0,0 +1,26 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+# Maximum number of queries each public view may run for a single request.
+QUERY_BUDGETS = {
+    'martyrs:home': 4,
+}
+
+
+class QueryBudgetMixin:
+    """TestCase mixin that fails when a view runs more queries than its budget."""
+
+    def assertWithinQueryBudget(self, url_name, budget=None, data=None, **kwargs):
+        if budget is None:
+            budget = QUERY_BUDGETS[url_name]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse(url_name, kwargs=kwargs or None), data)
+        executed = len(context.captured_queries)
+        if executed > budget:
+            queries = '\n'.join(
+                f'{i}. {query["sql"]}' for i, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(f'{url_name} ran {executed} queries, budget is {budget}:\n{queries}')
+        return response
@@ -1,3 +1,587 @@
-from django.test import TestCase
+from datetime import date
+from io import StringIO
+import json
+from pathlib import Path
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import views
+from .admin import EXACT_COUNT_THRESHOLD, EstimatedCountPaginator, estimated_row_count
+from .management.commands.process_enrichment_queue import RETRY_BACKOFF, STALE_AFTER
+from .models import EnrichmentJob, Martyr, PrayerIntention
+from .scrape_metrics import ScrapeMetrics
+from .scraping import fetch_article_content
+from .testing import QueryBudgetMixin
+
+
+LISTING_HTML = b'''
+<html><body>
+<article class="post">
+    <h2 class="title">Pastor John Adebayo killed in Nigeria</h2>
+    <a href="/news/john-adebayo">Read more</a>
+    <time datetime="2025-11-20">20 November 2025</time>
+    <p>Gunmen attacked the village church in Plateau State, Nigeria, killing the pastor during the Sunday service and wounding several members of his congregation.</p>
+</article>
+<article class="post">
+    <h2 class="title">Christians released after months in detention</h2>
+    <a href="/news/released">Read more</a>
+</article>
+<article class="post">
+    <h2>News</h2>
+</article>
+</body></html>
+'''
+
+
+# Tests clear and fill the cache freely, so never let them reach the shared
+# cache MARTYRS_CACHE_URL may point at.
+TEST_CACHES = override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+})
+
+
+def setUpModule():
+    TEST_CACHES.enable()
+
+
+def tearDownModule():
+    TEST_CACHES.disable()
+
+
+def create_martyrs(n, start=0, **overrides):
+    """Create n dated martyrs named 'Martyr {i}', oldest first."""
+    martyrs = []
+    for i in range(start, start + n):
+        fields = {
+            'name': f'Martyr {i}',
+            'country': 'Nigeria',
+            'date': date(2025, 1, i + 1),
+            'source_url': f'https://example.com/{i}',
+            'description': 'Killed for the faith.',
+        }
+        fields.update(overrides)
+        martyrs.append(Martyr.objects.create(**fields))
+    return martyrs
+
+
+def fake_response(content, content_type='text/html; charset=utf-8', chunk_size=1024):
+    response = mock.MagicMock()
+    response.__enter__.return_value = response
+    response.content = content
+    response.encoding = 'utf-8'
+    response.headers = {'Content-Type': content_type}
+    response.raise_for_status.return_value = None
+    response.chunks_read = 0
+
+    def iter_content(chunk_size=chunk_size):
+        for i in range(0, len(content), chunk_size):
+            response.chunks_read += 1
+            yield content[i:i + chunk_size]
+
+    response.iter_content.side_effect = iter_content
+    return response
+
+
+class FetchPersecutionDataMetricsTests(TestCase):
+    @mock.patch('martyrs.management.commands.fetch_persecution_data.time.sleep')
+    @mock.patch('requests.get')
+    def test_metrics_json_lines(self, mock_get, mock_sleep):
+        mock_get.return_value = fake_response(LISTING_HTML)
+        out = StringIO()
+
+        call_command('fetch_persecution_data', source='Persecution', metrics_json='-', stdout=out)
+
+        records = [json.loads(line) for line in out.getvalue().splitlines() if line.startswith('{')]
+        counters = {r['name']: r['value'] for r in records if r['type'] == 'counter'}
+        self.assertEqual(counters['items_seen'], 3)
+        self.assertEqual(counters['items_added'], 1)
+        self.assertEqual(counters['items_skipped'], 1)
+        self.assertEqual(counters['good_news_filtered'], 1)
+
+        self.assertEqual(len({(r['ts'], r['run_id']) for r in records}), 1)
+
+        fetches = [r for r in records if r['type'] == 'fetch']
+        self.assertEqual(fetches[0]['kind'], 'listing')
+        self.assertEqual(fetches[0]['bytes'], len(LISTING_HTML))
+        self.assertEqual(Martyr.objects.get().country, 'Nigeria')
+
+
+class FetchArticleContentTests(TestCase):
+    def setUp(self):
+        self.metrics = ScrapeMetrics()
+
+    def fetch(self, url='https://example.com/a'):
+        return fetch_article_content(url, self.metrics, 'Test')
+
+    @mock.patch('requests.get')
+    def test_prefers_article_body_paragraphs(self, mock_get):
+        mock_get.return_value = fake_response(
+            b'<html><body><p>Cookie banner</p><nav><p>Menu</p></nav>'
+            b'<article><h1>Title</h1><p>First paragraph of the <b>story</b>.</p><br>'
+            b'<p>Second paragraph with more detail about the attack.</p></article></body></html>'
+        )
+        text = self.fetch()
+        self.assertEqual(text, 'First paragraph of thestory. Second paragraph with more detail about the attack.')
+
+    @mock.patch('requests.get')
+    def test_generic_content_wrapper_has_lowest_priority(self, mock_get):
+        mock_get.return_value = fake_response(
+            b'<html><body><div class="content"><p>We use cookies to improve your experience on this site.</p>'
+            b'<article><p>Pastor Musa was killed when gunmen attacked his church in Benue State.</p>'
+            b'</article></div></body></html>'
+        )
+        text = self.fetch()
+        self.assertEqual(text, 'Pastor Musa was killed when gunmen attacked his church in Benue State.')
+
+    @mock.patch('requests.get')
+    def test_honours_meta_charset_without_header_charset(self, mock_get):
+        mock_get.return_value = fake_response(
+            '<html><head><meta http-equiv="Content-Type" content="text/html; charset=windows-1252"></head>'
+            '<body><article><p>Père Jean-Baptiste was abducted from the mission at Bangassou.</p>'
+            '</article></body></html>'.encode('cp1252'),
+            content_type='text/html',
+        )
+        self.assertEqual(self.fetch(), 'Père Jean-Baptiste was abducted from the mission at Bangassou.')
+
+    @mock.patch('requests.get')
+    def test_falls_back_to_first_paragraphs(self, mock_get):
+        mock_get.return_value = fake_response(b'<html><body><div><p>Only</p><p>short text</p></div></body></html>')
+        text = self.fetch()
+        self.assertEqual(text, 'Only short text')
+
+    @mock.patch('requests.get')
+    def test_stops_downloading_once_enough_text(self, mock_get):
+        paragraph = b'<p>' + b'Persecution continues in the region. ' * 10 + b'</p>'
+        body = b'<html><body><article>' + paragraph * 2000 + b'</article></body></html>'
+        response = fake_response(body)
+        mock_get.return_value = response
+
+        text = self.fetch()
+
+        self.assertEqual(len(text), 1000)
+        self.assertLess(response.chunks_read, 3)
+        self.assertEqual(self.metrics.counters[('Test', 'articles_stopped_early')], 1)
+
+    @mock.patch('requests.get')
+    def test_rejects_non_html(self, mock_get):
+        response = fake_response(b'%PDF-1.7', content_type='application/pdf')
+        mock_get.return_value = response
+
+        self.assertIsNone(self.fetch('https://example.com/a.pdf'))
+        self.assertEqual(response.chunks_read, 0)
+        self.assertEqual(self.metrics.counters[('Test', 'articles_non_html')], 1)
+
+
+class EnrichmentQueueTests(TestCase):
+    def queue_job(self, title='Daniel Bulus'):
+        [martyr] = create_martyrs(
+            1,
+            name='Daniel Bulus',
+            country='Unknown',
+            source_url='https://example.com/bulus',
+            description='Gunmen struck overnight.',
+        )
+        return EnrichmentJob.objects.create(martyr=martyr, url=martyr.source_url, title=title)
+
+    @mock.patch('martyrs.management.commands.fetch_persecution_data.time.sleep')
+    @mock.patch('requests.get')
+    def test_ingest_queues_and_worker_enriches(self, mock_get, mock_sleep):
+        mock_get.return_value = fake_response(
+            b'<html><body><article class="post">'
+            b'<h2 class="title">Pastor Daniel Bulus abducted</h2>'
+            b'<a href="/news/bulus">Read more</a><p>Gunmen struck overnight.</p>'
+            b'</article></body></html>'
+        )
+        call_command('fetch_persecution_data', source='Persecution', stdout=StringIO())
+
+        self.assertEqual(mock_get.call_count, 1)
+        martyr = Martyr.objects.get()
+        self.assertEqual(martyr.description, 'Gunmen struck overnight.')
+        self.assertEqual(martyr.country, 'Unknown')
+        job = EnrichmentJob.objects.get()
+        self.assertEqual((job.martyr, job.status), (martyr, EnrichmentJob.PENDING))
+
+        mock_get.return_value = fake_response(
+            b'<html><body><article><p>Gunmen struck the village in Plateau State in Nigeria '
+            b'and abducted the pastor from his home.</p></article></body></html>'
+        )
+        call_command('process_enrichment_queue', once=True, stdout=StringIO())
+
+        martyr.refresh_from_db()
+        self.assertTrue(martyr.description.startswith('Gunmen struck the village'))
+        self.assertEqual(martyr.country, 'Nigeria')
+        self.assertEqual(EnrichmentJob.objects.get().status, EnrichmentJob.DONE)
+
+    @mock.patch('requests.get')
+    def test_good_news_in_article_removes_martyr(self, mock_get):
+        self.queue_job(title='Update on Pastor Daniel Bulus')
+        mock_get.return_value = fake_response(
+            b'<html><body><article><p>Pastor Daniel Bulus was released on Tuesday after '
+            b'three weeks in captivity in Kaduna State.</p></article></body></html>'
+        )
+        out = StringIO()
+        call_command('process_enrichment_queue', once=True, stdout=out)
+
+        self.assertFalse(Martyr.objects.exists())
+        self.assertFalse(EnrichmentJob.objects.exists())
+        self.assertIn('0 enriched, 1 filtered as good news', out.getvalue())
+
+    @mock.patch('martyrs.management.commands.process_enrichment_queue.call_command')
+    @mock.patch('requests.get')
+    def test_worker_writes_metrics_and_rebuilds_site(self, mock_get, mock_call_command):
+        self.queue_job()
+        mock_get.return_value = fake_response(
+            b'<html><body><article><p>Gunmen struck the village in Plateau State in Nigeria '
+            b'and abducted the pastor from his home.</p></article></body></html>'
+        )
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        metrics_path = Path(tmp.name) / 'metrics.jsonl'
+        textfile_path = Path(tmp.name) / 'enrichment.prom'
+
+        call_command(
+            'process_enrichment_queue', once=True, build_static_site=True,
+            metrics_json=str(metrics_path), prometheus_textfile=str(textfile_path), stdout=StringIO(),
+        )
+
+        records = [json.loads(line) for line in metrics_path.read_text().splitlines()]
+        fetches = [r for r in records if r['type'] == 'fetch']
+        self.assertEqual([(r['source'], r['kind'], r['count']) for r in fetches], [('Enrichment', 'article', 1)])
+        self.assertIn('martyrs_scrape_fetch_seconds_count{source="Enrichment",kind="article"} 1', textfile_path.read_text())
+        self.assertEqual(mock_call_command.call_count, 1)
+        self.assertEqual(mock_call_command.call_args.args, ('build_static_site',))
+
+    @mock.patch('martyrs.management.commands.process_enrichment_queue.time.sleep')
+    @mock.patch('requests.get')
+    def test_polling_worker_requeues_jobs_of_dead_siblings(self, mock_get, mock_sleep):
+        job = self.queue_job()
+        EnrichmentJob.objects.update(status=EnrichmentJob.RUNNING)
+        mock_get.return_value = fake_response(
+            b'<html><body><article><p>Gunmen struck the village in Plateau State in Nigeria '
+            b'and abducted the pastor from his home.</p></article></body></html>'
+        )
+
+        def poll_sleep(seconds):
+            if mock_sleep.call_count > 1:
+                raise KeyboardInterrupt
+            # The sibling that claimed the job dies while the worker waits.
+            EnrichmentJob.objects.update(updated_at=timezone.now() - STALE_AFTER * 2)
+
+        mock_sleep.side_effect = poll_sleep
+        with self.assertRaises(KeyboardInterrupt):
+            call_command('process_enrichment_queue', stdout=StringIO())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, EnrichmentJob.DONE)
+
+    @mock.patch('requests.get')
+    def test_failed_fetch_is_retried_then_marked_failed(self, mock_get):
+        mock_get.return_value = fake_response(b'%PDF', content_type='application/pdf')
+        self.queue_job()
+
+        call_command('process_enrichment_queue', once=True, stdout=StringIO())
+
+        job = EnrichmentJob.objects.get()
+        self.assertEqual((job.status, job.attempts), (EnrichmentJob.PENDING, 1))
+        self.assertGreater(job.next_attempt_at, timezone.now())
+        self.assertEqual(mock_get.call_count, 1)
+
+        EnrichmentJob.objects.update(next_attempt_at=timezone.now())
+        call_command('process_enrichment_queue', once=True, stdout=StringIO())
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (EnrichmentJob.PENDING, 2))
+        self.assertGreater(job.next_attempt_at, timezone.now() + RETRY_BACKOFF)
+
+        EnrichmentJob.objects.update(next_attempt_at=timezone.now())
+        call_command('process_enrichment_queue', once=True, stdout=StringIO())
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (EnrichmentJob.FAILED, 3))
+        self.assertEqual(mock_get.call_count, 3)
+
+
+class HomeViewPerformanceTests(QueryBudgetMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_martyrs(5)
+        for i in range(5):
+            PrayerIntention.objects.create(title=f'Intention {i}', details='For peace.')
+
+    def test_home_query_budget(self):
+        self.assertWithinQueryBudget('martyrs:home')
+        self.assertWithinQueryBudget('martyrs:home', data={'page': 2, 'prayer_page': 2})
+
+    def test_server_timing_header(self):
+        response = self.client.get(reverse('martyrs:home'))
+        server_timing = response['Server-Timing']
+        self.assertIn('db;dur=', server_timing)
+        self.assertIn('desc="4 queries"', server_timing)
+        self.assertIn('render;dur=', server_timing)
+        self.assertIn('total;dur=', server_timing)
+
+
+class AsyncHomeViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_martyrs(5)
+
+    def setUp(self):
+        cache.clear()
+
+    async def test_pages_match_sync_view(self):
+        request = AsyncRequestFactory().get('/', {'page': 2})
+        response = await views.home_async(request)
+        martyrs = response.context_data['martyrs']
+        self.assertEqual(martyrs.number, 2)
+        self.assertEqual(martyrs.paginator.num_pages, 2)
+        self.assertEqual([m.name for m in martyrs], ['Martyr 1', 'Martyr 0'])
+        response.render()
+        self.assertContains(response, 'Martyr 1')
+
+    async def test_out_of_range_page_falls_back_to_last(self):
+        request = AsyncRequestFactory().get('/', {'page': 99, 'prayer_page': 'x'})
+        response = await views.home_async(request)
+        self.assertEqual(response.context_data['martyrs'].number, 2)
+        self.assertEqual(response.context_data['prayer_intentions'].number, 1)
+
+    async def test_count_cache_invalidated_on_save(self):
+        await views.aget_page(Martyr.objects.all(), 3, 1)
+        await Martyr.objects.acreate(
+            name='Martyr 5',
+            country='Nigeria',
+            date=date(2025, 2, 1),
+            source_url='https://example.com/5',
+            description='Killed for the faith.',
+        )
+        page = await views.aget_page(Martyr.objects.all(), 3, 1)
+        self.assertEqual(page.paginator.count, 6)
+
+    async def test_filtered_list_does_not_share_count_cache(self):
+        await views.aget_page(Martyr.objects.all(), 3, 1)
+        page = await views.aget_page(Martyr.objects.filter(name='Martyr 0'), 3, 1)
+        self.assertEqual(page.paginator.count, 1)
+        page = await views.aget_page(Martyr.objects.all(), 3, 1)
+        self.assertEqual(page.paginator.count, 5)
+
+
+class BuildStaticSiteTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_martyrs(7)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.output = Path(tmp.name)
+
+    def build(self):
+        out = StringIO()
+        call_command('build_static_site', output=str(self.output), stdout=out)
+        return out.getvalue()
+
+    def test_incremental_rebuild(self):
+        self.assertIn('3 rendered, 0 unchanged, 0 removed', self.build())
+        self.assertTrue((self.output / 'page-3.html.gz').exists())
+        self.assertFileContains('page-2.html', 'Martyr 3')
+
+        self.assertIn('0 rendered, 3 unchanged', self.build())
+        martyr = Martyr.objects.get(name='Martyr 0')
+        self.assertIsNone(cache.get(views.card_cache_key(martyr)))
+
+        martyr.description = 'Updated account.'
+        martyr.save()
+        self.assertIn('1 rendered, 2 unchanged', self.build())
+        self.assertFileContains('page-3.html', 'Updated account.')
+
+        # Dropping a page changes "Page x of y" on every remaining page.
+        Martyr.objects.filter(name='Martyr 0').delete()
+        self.assertIn('2 rendered, 0 unchanged, 1 removed', self.build())
+        self.assertFalse((self.output / 'page-3.html').exists())
+
+    def assertFileContains(self, filename, text):
+        self.assertIn(text, (self.output / filename).read_text())
+
+
+class FeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Martyr.objects.create(
+            name='John Adebayo',
+            country='Nigeria',
+            date=date(2025, 1, 1),
+            source_url='https://example.com/adebayo',
+            description='Killed during Sunday service.',
+        )
+        PrayerIntention.objects.create(title='For Plateau State', details='For peace.')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_feeds_render(self):
+        for name in ['martyrs_feed', 'martyrs_atom_feed', 'prayer_intentions_feed', 'prayer_intentions_atom_feed']:
+            response = self.client.get(reverse(f'martyrs:{name}'))
+            self.assertEqual(response.status_code, 200)
+        response = self.client.get(reverse('martyrs:country_feed', args=['nigeria']))
+        self.assertContains(response, 'John Adebayo')
+        response = self.client.get(reverse('martyrs:country_feed', args=['Chad']))
+        self.assertEqual(response.status_code, 404)
+
+    def test_cached_with_conditional_get(self):
+        url = reverse('martyrs:martyrs_feed')
+        response = self.client.get(url)
+        etag = response['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertContains(response, 'John Adebayo')
+
+    def test_write_invalidates_cache(self):
+        url = reverse('martyrs:martyrs_feed')
+        etag = self.client.get(url)['ETag']
+        Martyr.objects.create(
+            name='Mary Musa',
+            country='Nigeria',
+            date=date(2025, 1, 2),
+            source_url='https://example.com/musa',
+            description='Abducted from her village.',
+        )
+        response = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Mary Musa')
+
+    def test_bulk_write_invalidates_only_its_feeds(self):
+        martyrs_url = reverse('martyrs:martyrs_feed')
+        prayers_url = reverse('martyrs:prayer_intentions_feed')
+        martyrs_etag = self.client.get(martyrs_url)['ETag']
+        prayers_etag = self.client.get(prayers_url)['ETag']
+
+        call_command('generate_synthetic_martyrs', 5, stdout=StringIO())
+
+        response = self.client.get(martyrs_url, headers={'If-None-Match': martyrs_etag})
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(prayers_url, headers={'If-None-Match': prayers_etag})
+        self.assertEqual(response.status_code, 304)
+
+
+class MartyrAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        create_martyrs(2)
+        create_martyrs(1, start=2, country='Pakistan')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def test_changelist_filters_by_cached_country_list(self):
+        url = reverse('admin:martyrs_martyr_changelist')
+        response = self.client.get(url)
+        self.assertEqual(response.context['cl'].result_count, 3)
+        self.assertContains(response, '?country=Pakistan')
+        self.assertEqual(cache.get('martyrs:countries'), ['Nigeria', 'Pakistan'])
+
+        response = self.client.get(url, {'country': 'Nigeria'})
+        self.assertEqual(response.context['cl'].result_count, 2)
+
+    def test_changelist_defers_description(self):
+        response = self.client.get(reverse('admin:martyrs_martyr_changelist'))
+        martyr = response.context['cl'].result_list[0]
+        self.assertIn('description', martyr.get_deferred_fields())
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_martyrs(3)
+
+    @mock.patch('martyrs.admin.estimated_row_count', return_value=EXACT_COUNT_THRESHOLD + 1)
+    def test_large_unfiltered_list_uses_estimate(self, estimated_row_count):
+        paginator = EstimatedCountPaginator(Martyr.objects.all(), 100)
+        with self.assertNumQueries(0):
+            self.assertEqual(paginator.count, EXACT_COUNT_THRESHOLD + 1)
+        estimated_row_count.assert_called_once_with(Martyr)
+
+    @mock.patch('martyrs.admin.estimated_row_count', return_value=EXACT_COUNT_THRESHOLD - 1)
+    def test_small_list_counts_exactly(self, estimated_row_count):
+        paginator = EstimatedCountPaginator(Martyr.objects.all(), 100)
+        self.assertEqual(paginator.count, 3)
+
+    @mock.patch('martyrs.admin.estimated_row_count', return_value=EXACT_COUNT_THRESHOLD + 1)
+    def test_filtered_list_counts_exactly(self, estimated_row_count):
+        paginator = EstimatedCountPaginator(Martyr.objects.filter(name='Martyr 0'), 100)
+        self.assertEqual(paginator.count, 1)
+        estimated_row_count.assert_not_called()
+
+    def test_no_estimate_on_sqlite(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        self.assertIsNone(estimated_row_count(Martyr))
+
+
+class GenerateSyntheticMartyrsTests(TestCase):
+    def test_samples_existing_distribution(self):
+        Martyr.objects.create(
+            name='John Adebayo',
+            country='Nigeria',
+            date=date(2025, 6, 1),
+            source_url='https://example.com/adebayo',
+            description='x' * 200,
+        )
+        cache.set('martyrs:countries', ['Nigeria'])
+
+        call_command('generate_synthetic_martyrs', 50, batch_size=20, stdout=StringIO())
+
+        synthetic = Martyr.objects.filter(source_url__startswith='https://synthetic.invalid/')
+        self.assertEqual(synthetic.count(), 50)
+        self.assertEqual(set(synthetic.values_list('country', flat=True)), {'Nigeria'})
+        self.assertTrue(all(len(d) <= 200 for d in synthetic.values_list('description', flat=True)))
+        self.assertIsNone(cache.get('martyrs:countries'))
+
+        call_command('generate_synthetic_martyrs', 10, delete=True, stdout=StringIO())
+        self.assertEqual(synthetic.count(), 10)
+
+
+class MartyrCardCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.martyr = Martyr.objects.create(
+            name='John Adebayo',
+            country='Nigeria',
+            date=date(2025, 1, 1),
+            source_url='https://example.com/adebayo',
+            description='Killed during Sunday service.',
+        )
+
+    def test_cards_cached_until_row_changes(self):
+        rows = list(views.martyr_card_rows())
+        self.assertNotIn('created_at', rows[0]._fields)
+        cards = views.render_martyr_cards(rows)
+        self.assertIn('Killed during Sunday service.', cards[0])
+        self.assertEqual(cache.get(views.card_cache_key(rows[0])), cards[0])
+
+        with mock.patch('martyrs.views.get_template') as get_template:
+            get_template.return_value.render.side_effect = AssertionError('card re-rendered')
+            self.assertEqual(views.render_martyr_cards(rows), cards)
+
+        self.martyr.description = 'Abducted after the service.'
+        self.martyr.save()
+        response = self.client.get(reverse('martyrs:home'))
+        self.assertContains(response, 'Abducted after the service.')
+        self.assertNotContains(response, 'Killed during Sunday service.')
+
+    def test_template_edit_changes_cache_key(self):
+        key = views.card_cache_key(self.martyr)
+        self.addCleanup(views.card_cache_version.cache_clear)
+        views.card_cache_version.cache_clear()
+        with mock.patch.object(Path, 'read_bytes', return_value=b'<div>{{ martyr.name }}</div>'):
+            self.assertNotEqual(views.card_cache_key(self.martyr), key)
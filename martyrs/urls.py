@@ -1,9 +1,15 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import feeds, views
 
 app_name = 'martyrs'
 
 urlpatterns = [
-    path('', views.home, name='home'),
+    path('', views.home_async if settings.ASYNC_VIEWS else views.home, name='home'),
+    path('feeds/martyrs/', feeds.cached_feed(feeds.LatestMartyrsFeed()), name='martyrs_feed'),
+    path('feeds/martyrs/atom/', feeds.cached_feed(feeds.LatestMartyrsAtomFeed()), name='martyrs_atom_feed'),
+    path('feeds/martyrs/country/<str:country>/', feeds.cached_feed(feeds.CountryMartyrsFeed()), name='country_feed'),
+    path('feeds/martyrs/country/<str:country>/atom/', feeds.cached_feed(feeds.CountryMartyrsAtomFeed()), name='country_atom_feed'),
+    path('feeds/prayer-intentions/', feeds.cached_feed(feeds.PrayerIntentionsFeed()), name='prayer_intentions_feed'),
+    path('feeds/prayer-intentions/atom/', feeds.cached_feed(feeds.PrayerIntentionsAtomFeed()), name='prayer_intentions_atom_feed'),
 ]
-
@@ -1,10 +1,73 @@
-from django.shortcuts import render
-from django.core.paginator import Paginator
+from functools import lru_cache
+import hashlib
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.template.loader import get_template
+from django.template.response import TemplateResponse
+from django.utils.safestring import mark_safe
 from .models import Martyr, PrayerIntention
+from .signals import count_cache_key
+
+
+# Cached row counts are invalidated on save/delete; the timeout bounds how
+# stale they can get after bulk writes, which bypass signals.
+COUNT_CACHE_TIMEOUT = 300
+
+# Columns a martyr card displays, plus what its cache key needs.
+MARTYR_CARD_FIELDS = ['id', 'name', 'country', 'date', 'source_url', 'description', 'updated_at']
+
+CARD_TEMPLATE = 'martyrs/martyr_card.html'
+CARD_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def martyr_card_rows():
+    return Martyr.objects.values_list(*MARTYR_CARD_FIELDS, named=True)
+
+
+@lru_cache(maxsize=None)
+def card_cache_version():
+    """Hash of the card template's source, so editing it retires cached cards."""
+    source = Path(get_template(CARD_TEMPLATE).origin.name).read_bytes()
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def card_cache_key(martyr):
+    return f'martyrs:card:{card_cache_version()}:{martyr.id}:{martyr.updated_at.timestamp():.6f}'
+
+
+def build_martyr_cards(martyrs, keys, cached):
+    template = get_template(CARD_TEMPLATE)
+    cards = []
+    missing = {}
+    for martyr, key in zip(martyrs, keys):
+        card = cached.get(key)
+        if card is None:
+            card = missing[key] = template.render({'martyr': martyr})
+        cards.append(mark_safe(card))
+    return cards, missing
+
+
+def render_martyr_cards(martyrs):
+    """Rendered card markup for each martyr, served from the cache where possible."""
+    keys = [card_cache_key(martyr) for martyr in martyrs]
+    cards, missing = build_martyr_cards(martyrs, keys, cache.get_many(keys))
+    if missing:
+        cache.set_many(missing, CARD_CACHE_TIMEOUT)
+    return cards
+
+
+async def arender_martyr_cards(martyrs):
+    keys = [card_cache_key(martyr) for martyr in martyrs]
+    cards, missing = build_martyr_cards(martyrs, keys, await cache.aget_many(keys))
+    if missing:
+        await cache.aset_many(missing, CARD_CACHE_TIMEOUT)
+    return cards
 
 
 def home(request):
-    martyrs_list = Martyr.objects.all()
+    martyrs_list = martyr_card_rows()
     paginator = Paginator(martyrs_list, 3)
     page_number = request.GET.get('page')
     martyrs = paginator.get_page(page_number)
@@ -16,7 +79,47 @@ def home(request):
     
     context = {
         'martyrs': martyrs,
+        'martyr_cards': render_martyr_cards(martyrs),
+        'prayer_intentions': prayer_intentions,
+    }
+    
+    return TemplateResponse(request, 'martyrs/home.html', context)
+
+
+async def aget_page(object_list, per_page, number):
+    """Async counterpart of Paginator.get_page() that evaluates the page eagerly."""
+    paginator = Paginator(object_list, per_page)
+    if object_list.query.has_filters():
+        # The cached count is per model, so only unfiltered lists may use it.
+        count = await object_list.acount()
+    else:
+        key = count_cache_key(object_list.model)
+        count = await cache.aget(key)
+        if count is None:
+            count = await object_list.acount()
+            await cache.aset(key, count, COUNT_CACHE_TIMEOUT)
+    paginator.count = count
+    
+    try:
+        number = paginator.validate_number(number)
+    except PageNotAnInteger:
+        number = 1
+    except EmptyPage:
+        number = paginator.num_pages
+    
+    bottom = (number - 1) * per_page
+    objects = [obj async for obj in object_list[bottom:bottom + per_page]]
+    return Page(objects, number, paginator)
+
+
+async def home_async(request):
+    martyrs = await aget_page(martyr_card_rows(), 3, request.GET.get('page'))
+    prayer_intentions = await aget_page(PrayerIntention.objects.all(), 3, request.GET.get('prayer_page'))
+    
+    context = {
+        'martyrs': martyrs,
+        'martyr_cards': await arender_martyr_cards(martyrs),
         'prayer_intentions': prayer_intentions,
     }
     
-    return render(request, 'martyrs/home.html', context)
+    return TemplateResponse(request, 'martyrs/home.html', context)